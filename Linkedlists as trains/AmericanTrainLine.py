@@ -1,3 +1,5 @@
+from __future__ import annotations
+from typing import Iterable
 from Station import Station
 
 # 1234567890123456789012345678901234567890123456789012345678901234567890123456789
@@ -29,6 +31,33 @@ class AmericanTrainLine:
             # of the trainline
             cursor.set_next(new_station)
 
+    @classmethod
+    def from_names(cls, name: str, names: Iterable[str]) -> "AmericanTrainLine":
+        """Builds a whole line from an iterable of station names. Calling add()
+        for each name would walk the line every time, O(n^2) in total; here
+        the stations are chained in a single pass."""
+        line = cls(name)
+        line.extend(map(Station, names))
+        return line
+
+    def extend(self, stations: Iterable["Station"]) -> None:
+        """Adds a batch of stations to the end of the line. The line is
+        traversed once to find its last station, no matter how many stations
+        are in the batch."""
+        # Find the last station, if any, just like add() does.
+        cursor: "Station" | None = self._head
+        while cursor is not None and cursor.has_next():
+            cursor = cursor.get_next()
+        for station in stations:
+            if cursor is None:
+                self._head = station
+            else:
+                cursor.set_next(station)
+            cursor = station
+        # The last station of the batch ends the line.
+        if cursor is not None:
+            cursor.set_next(None)
+
     def count_stations(self) -> int:
         """Returns the number of train stations in the line."""
         count: int = 0
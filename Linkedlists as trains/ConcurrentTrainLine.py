@@ -0,0 +1,139 @@
+from __future__ import annotations
+import threading
+from typing import Iterable, Iterator
+from EuropeanTrainLine import EuropeanTrainLine
+from Station import Station
+
+# 1234567890123456789012345678901234567890123456789012345678901234567890123456789
+
+
+class ConcurrentTrainLine(EuropeanTrainLine):
+
+    """A EuropeanTrainLine that several threads can append to at once. Writers
+    take a lock that guards the tail, the count and the name index, so no
+    station is lost. Iteration does not take the lock: it reads the count
+    once and walks only that many stations, which were all linked before the
+    count grew. So iterating always gives a consistent prefix of the line,
+    without the stations appended meanwhile.
+
+    Lookups on an indexed line take the lock, since a delete may renumber
+    the index while they read it. Lookups on a line without an index walk it
+    without the lock; they are exact with concurrent appends, but a
+    concurrent delete can shift the position they report."""
+
+    def __init__(self, name: str, indexed: bool = False) -> None:
+        """Constructor to set the name of the trainline object and create its
+        writer lock. The lock is reentrant because split_at_middle() holds it
+        while calling find_middle(), which takes it as well."""
+        super().__init__(name, indexed)
+        self._tail_lock = threading.RLock()
+
+    def add(self, new_station: "Station" | str) -> None:
+        """Adds a new station to the end of the line. The Station object is
+        created before taking the lock, to keep the locked part short."""
+        if isinstance(new_station, str):
+            new_station = Station(new_station)
+        with self._tail_lock:
+            super().add(new_station)
+
+    def add_many(self, stations: Iterable["Station" | str]) -> None:
+        """Adds a batch of stations to the end of the line. The batch is chained
+        together without the lock, which is then taken once to attach the
+        whole chain after the tail."""
+        first, last, added = self._chain(
+            station if isinstance(station, Station) else Station(station)
+            for station in stations)
+        with self._tail_lock:
+            self._attach(first, last, added)
+
+    def extend(self, stations: Iterable["Station" | str]) -> None:
+        """Same as add_many()."""
+        self.add_many(stations)
+
+    def delete(self, index: int) -> "Station":
+        """Removes and returns the station at the given position, holding the
+        writer lock. A reader walking over the removed station at that moment
+        stops early instead of failing."""
+        with self._tail_lock:
+            removed = super().delete(index)
+        return removed
+
+    def split_at_middle(self, name: str) -> "ConcurrentTrainLine":
+        """Cuts the line after its middle station, holding the writer lock."""
+        with self._tail_lock:
+            second = super().split_at_middle(name)
+        return second
+
+    def find_middle(self) -> "Station" | None:
+        """Returns the middle station, holding the writer lock. After load() or
+        split_at_middle() the middle is not known and is found by walking the
+        line; without the lock, an add() during that walk would not move the
+        middle, and the walk would then store the middle of the older, shorter
+        line."""
+        with self._tail_lock:
+            middle = super().find_middle()
+        return middle
+
+    def index_of(self, name: str) -> int:
+        """Returns the position of the first station with the given name, or
+        -1. On an indexed line this holds the writer lock, because the index
+        and its holes must be read together."""
+        if self._index is not None:
+            with self._tail_lock:
+                index = super().index_of(name)
+        else:
+            index = super().index_of(name)
+        return index
+
+    def exists(self, name: str) -> bool:
+        """Returns True iff a station with the given name is on the line. On an
+        indexed line this holds the writer lock, because a delete may be
+        rebuilding the index."""
+        if self._index is not None:
+            with self._tail_lock:
+                found = super().exists(name)
+        else:
+            found = super().exists(name)
+        return found
+
+    def __iter__(self) -> Iterator["Station"]:
+        """Yields, without locking, the stations that were on the line when the
+        iteration started."""
+        count = self._count
+        cursor = self._head
+        while count > 0 and cursor is not None:
+            yield cursor
+            cursor = cursor.get_next()
+            count -= 1
+
+
+# --- Stress benchmark: appending threads ---
+if __name__ == "__main__":
+    import time
+
+    PER_THREAD = 100_000
+    BATCH = 1_000
+
+    def append_one_by_one(line: ConcurrentTrainLine, prefix: str) -> None:
+        for i in range(PER_THREAD):
+            line.add(f"{prefix} {i}")
+
+    def append_in_batches(line: ConcurrentTrainLine, prefix: str) -> None:
+        for start in range(0, PER_THREAD, BATCH):
+            line.add_many(f"{prefix} {i}" for i in range(start, start + BATCH))
+
+    for worker in (append_one_by_one, append_in_batches):
+        for threads in (1, 2, 4, 8, 16):
+            line = ConcurrentTrainLine("Stress")
+            workers = [threading.Thread(target=worker, args=(line, f"T{t}"))
+                       for t in range(threads)]
+            start = time.perf_counter()
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            expected = threads * PER_THREAD
+            assert len(line) == expected == sum(1 for _ in line), "lost stations"
+            print(f"{worker.__name__:>18}, {threads:2} threads: "
+                  f"{expected / elapsed:12,.0f} stations/s")
@@ -1,4 +1,10 @@
+from __future__ import annotations
+from itertools import islice
+from math import isqrt
+from typing import Iterable, Iterator
 from Station import Station
+from AmericanTrainLine import AmericanTrainLine
+from LineSnapshot import LineSnapshot
 
 # 1234567890123456789012345678901234567890123456789012345678901234567890123456789
 
@@ -13,13 +19,33 @@ class EuropeanTrainLine:
     _PLURAL = _SINGULAR + "s"
     _EMPTY = _PLURAL
 
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, indexed: bool = False) -> None:
         """Constructor to set the name of the trainline object. Its head
-        station is determined later, when we are adding stations to it."""
+        station is determined later, when we are adding stations to it.
+        When indexed is True, the line also keeps a hash index of station
+        names so that exists() and index_of() do not traverse the line."""
         self._name = name
         self._head: "Station" | None = None
         self._tail: "Station" | None = None
         self._count: int = 0
+        # Station at position (count - 1) // 2, kept up to date by add() and
+        # delete() so that find_middle() is O(1). None also means "not known
+        # yet", e.g. after load(); find_middle() then finds and caches it.
+        self._middle: "Station" | None = None
+        # Optional name index: every name maps its stations to their tickets,
+        # in line order. Tickets are handed out in increasing order as stations
+        # are added to the end, so a station's position is its ticket minus
+        # the number of deleted tickets (holes) smaller than it. A delete just
+        # records a hole instead of renumbering every station after it. The
+        # holes are counted in a Fenwick tree: _holes[i] holds the number of
+        # holes among tickets i - (i & -i) .. i - 1, so marking a hole and
+        # counting the holes below a ticket both take O(log n) steps.
+        self._index: dict[str, dict["Station", int]] | None = None
+        self._next_ticket: int = 0
+        self._holes: list[int] = []
+        self._hole_count: int = 0
+        if indexed:
+            self._rebuild_index()
 
     def add(self, new_station: "Station"|str) -> None:
         """Adds a new station to the train line. The method accepts string or
@@ -45,6 +71,429 @@ class EuropeanTrainLine:
         self._tail.set_next(None)
         # Update the count of stations in the line.
         self._count += 1
+        self._move_middle_after_append(1)
+        # Keep the name index, if any, in sync with the line.
+        if self._index is not None:
+            self._index_station(new_station)
+
+    @classmethod
+    def from_names(cls, name: str, names: Iterable[str],
+                   indexed: bool = False) -> "EuropeanTrainLine":
+        """Builds a whole line from an iterable of station names in a single
+        pass. Every input is known to be a string, so there is no type check
+        per station."""
+        line = cls(name, indexed)
+        line._link(map(Station, names))
+        return line
+
+    @classmethod
+    def from_american(cls, line: AmericanTrainLine,
+                      indexed: bool = False) -> "EuropeanTrainLine":
+        """Upgrades an AmericanTrainLine to a EuropeanTrainLine with a single
+        traversal that finds the tail and counts the stations. The Station
+        objects are taken over, not copied, so the American line should not
+        be modified afterwards."""
+        upgraded = cls(str(line))
+        upgraded._head = line._head
+        cursor = line._head
+        while cursor is not None:
+            upgraded._tail = cursor
+            upgraded._count += 1
+            cursor = cursor.get_next()
+        if indexed:
+            upgraded._rebuild_index()
+        return upgraded
+
+    @classmethod
+    def load(cls, path: str, indexed: bool = False) -> "EuropeanTrainLine":
+        """Loads a line written by save(). The file is memory-mapped and only
+        its header is read here; each Station is created when a traversal
+        first reaches it. Building the name index, if requested, traverses
+        the whole line and so gives up that laziness."""
+        snapshot = LineSnapshot(path)
+        line = cls(snapshot.name)
+        line._head = snapshot.station(snapshot.head)
+        line._tail = snapshot.station(snapshot.tail)
+        line._count = snapshot.count
+        if indexed:
+            line._rebuild_index()
+        return line
+
+    def save(self, path: str) -> None:
+        """Writes the line to a compact binary file: a string table with the
+        station names and an int32 column of next links (see LineSnapshot).
+        Do not save over the file a line was loaded from: it is still mapped
+        into memory and unread stations come from it."""
+        LineSnapshot.write(path, self._name, self.iter_names(), self._count)
+
+    def extend(self, stations: Iterable["Station" | str]) -> None:
+        """Adds a batch of stations (Station objects or names) to the end of
+        the line. Same result as calling add() for each one, but the tail and
+        the count are updated only once for the whole batch."""
+        self._link(station if isinstance(station, Station) else Station(station)
+                   for station in stations)
+
+    def _link(self, stations: Iterable["Station"]) -> None:
+        """Chains the given Station objects together in one pass, then attaches
+        the new chain after the current tail."""
+        self._attach(*self._chain(stations))
+
+    @staticmethod
+    def _chain(stations: Iterable["Station"]
+               ) -> tuple["Station" | None, "Station" | None, int]:
+        """Links the given stations to each other, in order, and returns the
+        first and last of them along with how many there are. The chain is
+        not attached to any line yet."""
+        first = None
+        last = None
+        added = 0
+        for station in stations:
+            if first is None:
+                first = station
+            else:
+                last.set_next(station)
+            last = station
+            added += 1
+        if last is not None:
+            last.set_next(None)
+        return first, last, added
+
+    def _attach(self, first: "Station" | None, last: "Station" | None,
+                added: int) -> None:
+        """Attaches a chain built by _chain() after the current tail. The
+        stations are linked before the count grows, so a reader that walks
+        only count stations never goes past a station that is not linked."""
+        # Attach the chain only if the batch was not empty.
+        if first is not None:
+            if self._head is None:
+                self._head = first
+            else:
+                self._tail.set_next(first)
+            self._tail = last
+            self._count += added
+            self._move_middle_after_append(added)
+            if self._index is not None:
+                # Index the new stations, in order, from the start of the chain.
+                cursor = first
+                for _ in range(added):
+                    self._index_station(cursor)
+                    cursor = cursor.get_next()
+
+    def _move_middle_after_append(self, added: int) -> None:
+        """Moves the middle pointer forward after the given number of stations
+        were appended: the middle position (count - 1) // 2 grows by one for
+        every two stations added."""
+        before = self._count - added
+        if before == 0:
+            # The line was empty: the head is the middle of a 1-station line.
+            self._middle = self._head
+            before = 1
+        if self._middle is not None:
+            for _ in range((self._count - 1) // 2 - (before - 1) // 2):
+                self._middle = self._middle.get_next()
+
+    def _index_station(self, station: "Station") -> None:
+        """Records a station just added to the end of the line in the index,
+        with the next available ticket."""
+        if self._next_ticket + 1 == len(self._holes):
+            self._grow_holes()
+        self._index.setdefault(station.get_name(), {})[station] = self._next_ticket
+        self._next_ticket += 1
+
+    def _grow_holes(self) -> None:
+        """Doubles the number of tickets the Fenwick tree covers. Its size is
+        a power of two, so of the new nodes only the last one spans old
+        tickets, all of them: it starts at the hole count, the rest at 0."""
+        size = len(self._holes) - 1
+        self._holes.extend([0] * size)
+        self._holes[-1] = self._hole_count
+
+    def _mark_hole(self, ticket: int) -> None:
+        """Records a deleted ticket in the Fenwick tree, in O(log n)."""
+        node = ticket + 1
+        while node < len(self._holes):
+            self._holes[node] += 1
+            node += node & -node
+        self._hole_count += 1
+
+    def _holes_before(self, ticket: int) -> int:
+        """Returns the number of deleted tickets smaller than the given one,
+        in O(log n)."""
+        holes = 0
+        node = ticket
+        while node > 0:
+            holes += self._holes[node]
+            node -= node & -node
+        return holes
+
+    def _unindex_station(self, station: "Station") -> None:
+        """Removes a deleted station from the index and marks its ticket as a
+        hole, in O(log n). Once there are more holes than stations, the
+        tickets are renumbered in one pass, paid for by the deletes that
+        created the holes."""
+        entries = self._index[station.get_name()]
+        ticket = entries.pop(station)
+        if not entries:
+            del self._index[station.get_name()]
+        self._mark_hole(ticket)
+        if self._hole_count > self._count:
+            self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Builds the name index from scratch by traversing the line once,
+        handing out tickets 0, 1, 2, ... from head to tail."""
+        self._index = {}
+        self._next_ticket = 0
+        # A Fenwick tree over a power-of-two number of tickets, all live
+        size = 16
+        while size <= self._count:
+            size *= 2
+        self._holes = [0] * (size + 1)
+        self._hole_count = 0
+        cursor = self._head
+        while cursor is not None:
+            self._index_station(cursor)
+            cursor = cursor.get_next()
+
+    def delete(self, index: int) -> "Station":
+        """Removes and returns the station at the given position (head is 0).
+        Raises IndexError if the position is not on the line."""
+        if index < 0 or index >= self._count:
+            raise IndexError(f"Station index {index} out of range")
+        # Position of the middle station before the removal
+        middle = (self._count - 1) // 2
+        # Station just before the middle, noted if we walk past it
+        before_middle = None
+        if index == 0:
+            # Removing the head: its next station becomes the new head.
+            removed = self._head
+            self._head = removed.get_next()
+            previous = None
+        else:
+            # Travel to the station just before the one to remove.
+            previous = self._head
+            for position in range(1, index):
+                if position == middle:
+                    before_middle = previous
+                previous = previous.get_next()
+            removed = previous.get_next()
+            # Bypass the removed station.
+            previous.set_next(removed.get_next())
+        if removed is self._tail:
+            # The station before the removed one is the new last station.
+            self._tail = previous
+        following = removed.get_next()
+        # Detach the removed station from the line.
+        removed.set_next(None)
+        self._count -= 1
+        self._move_middle_after_delete(index, middle, previous, following,
+                                       before_middle)
+        if self._index is not None:
+            self._unindex_station(removed)
+        return removed
+
+    def _move_middle_after_delete(self, index: int, middle: int,
+                                  previous: "Station" | None,
+                                  following: "Station" | None,
+                                  before_middle: "Station" | None) -> None:
+        """Fixes the middle pointer after the station at position index was
+        removed. The middle position drops by one when the line had an odd
+        number of stations, and stays put otherwise. Stepping back is not
+        possible on a singly linked line, so delete() hands over the stations
+        around the removed one and the station before the middle, which its
+        walk passes whenever index > middle."""
+        odd_before = self._count % 2 == 0
+        if self._count == 0:
+            self._middle = None
+        elif self._middle is not None:
+            if index < middle:
+                # The middle station slid one position toward the head.
+                if not odd_before:
+                    self._middle = self._middle.get_next()
+            elif index == middle:
+                self._middle = previous if odd_before else following
+            elif odd_before:
+                self._middle = before_middle
+
+    def find_middle(self) -> "Station" | None:
+        """Returns the middle station, the first of the two middle stations
+        for an even count, or None for an empty line. The middle is kept up
+        to date by add() and delete(), so this is O(1); only when it is not
+        known yet (after load() or split_at_middle()) is it found by walking
+        half of the line, once."""
+        if self._middle is None and self._count > 0:
+            self._middle = self._head
+            for _ in range((self._count - 1) // 2):
+                self._middle = self._middle.get_next()
+        return self._middle
+
+    def split_at_middle(self, name: str) -> "EuropeanTrainLine":
+        """Cuts the line after its middle station. This line keeps the first
+        half, up to and including the middle, and a new line with the given
+        name gets the rest. Thanks to the middle pointer, no half is walked;
+        the middle of each half is found later, if find_middle() is called.
+        An indexed line still rebuilds both name indexes, which is O(n)."""
+        second = type(self)(name)
+        middle = self.find_middle()
+        if middle is not None and middle.has_next():
+            kept = (self._count - 1) // 2 + 1
+            second._head = middle.get_next()
+            second._tail = self._tail
+            second._count = self._count - kept
+            middle.set_next(None)
+            self._tail = middle
+            self._count = kept
+            self._middle = None
+        if self._index is not None:
+            self._rebuild_index()
+            second._rebuild_index()
+        return second
+
+    def index_of(self, name: str) -> int:
+        """Returns the position of the first station with the given name, or
+        -1 if there is no such station. With the name index this is a dict
+        lookup plus an O(log n) count of the holes left by deletes."""
+        index = -1
+        if self._index is not None:
+            entries = self._index.get(name)
+            if entries:
+                ticket = next(iter(entries.values()))
+                index = ticket - self._holes_before(ticket)
+        else:
+            position = 0
+            cursor = self._head
+            while cursor is not None and index == -1:
+                if cursor.get_name() == name:
+                    index = position
+                cursor = cursor.get_next()
+                position += 1
+        return index
+
+    def exists(self, name: str) -> bool:
+        """Returns True iff a station with the given name is on the line."""
+        if self._index is not None:
+            found = name in self._index
+        else:
+            found = self.index_of(name) != -1
+        return found
+
+    def has_loop(self) -> bool:
+        """Returns True iff following next pointers from the head never ends."""
+        _, loop_length, _ = self.loop_info()
+        return loop_length > 0
+
+    def loop_info(self, max_steps: int | None = None
+                  ) -> tuple["Station" | None, int, int] | None:
+        """Brent's cycle-finding algorithm. Returns a tuple (entry, length,
+        tail) where entry is the first station on the loop, length is the
+        number of stations on the loop and tail is the number of stations
+        before the entry. A line without a loop gives (None, 0, n), where n is
+        the number of stations actually reachable from the head.
+
+        The method does not trust the cached count, so it works on corrupted
+        lines. Compared with Floyd's method, the hare moves one station per
+        step and the tortoise teleports to the hare at powers of two, which
+        takes fewer pointer hops. With max_steps, the method gives up and
+        returns None when it has followed about that many next pointers
+        without reaching an answer."""
+        info = None
+        steps = 0
+        if self._head is None:
+            info = (None, 0, 0)
+        else:
+            # Phase 1: find the loop length. The hare explores windows of
+            # doubling size, starting each window from the tortoise.
+            power = 1
+            length = 1
+            tortoise = self._head
+            hare = self._head.get_next()
+            steps = 1
+            while (hare is not None and hare is not tortoise
+                   and (max_steps is None or steps < max_steps)):
+                if power == length:
+                    tortoise = hare
+                    power *= 2
+                    length = 0
+                hare = hare.get_next()
+                length += 1
+                steps += 1
+            if hare is None:
+                # The hare fell off the end after one hop per station.
+                info = (None, 0, steps)
+            elif hare is tortoise:
+                # Phase 2: find the entry. Start two cursors one loop length
+                # apart; they meet at the first station on the loop.
+                tortoise = self._head
+                hare = self._head
+                for _ in range(length):
+                    hare = hare.get_next()
+                steps += length
+                tail = 0
+                while (tortoise is not hare
+                       and (max_steps is None or steps < max_steps)):
+                    tortoise = tortoise.get_next()
+                    hare = hare.get_next()
+                    tail += 1
+                    steps += 2
+                if tortoise is hare:
+                    info = (tortoise, length, tail)
+        return info
+
+    def __iter__(self) -> Iterator["Station"]:
+        """Yields the stations from head to tail. Exactly count stations are
+        visited, so a corrupted line with a loop cannot trap the iteration."""
+        cursor = self._head
+        for _ in range(self._count):
+            yield cursor
+            cursor = cursor.get_next()
+
+    def iter_names(self) -> Iterator[str]:
+        """Yields the station names from head to tail without building a
+        list, e.g. to stream a long line to a file."""
+        for station in self:
+            yield station.get_name()
+
+    def list_stations(self) -> list[str]:
+        """Returns a Python list of the station names from head to tail."""
+        return list(self.iter_names())
+
+    def view(self, start: int, stop: int | None = None) -> Iterator[str]:
+        """Yields the names of the stations at positions start to stop - 1,
+        like itertools.islice. Nothing is copied; the stations before start
+        are only walked past."""
+        return islice(self.iter_names(), start, stop)
+
+    def __reversed__(self) -> Iterator["Station"]:
+        """Yields the stations from tail to head in O(n) time with O(sqrt(n))
+        extra memory. A first pass keeps a checkpoint every sqrt(n)
+        stations. Then, from the last checkpoint back to the first, each
+        segment is walked forward into a small buffer and yielded backward.
+        This avoids copying the whole line or recursing n levels deep."""
+        segment = max(1, isqrt(self._count))
+        checkpoints = []
+        total = 0
+        for station in self:
+            if total % segment == 0:
+                checkpoints.append(station)
+            total += 1
+        # The last segment may be shorter than the others.
+        remaining = total - (len(checkpoints) - 1) * segment
+        for checkpoint in reversed(checkpoints):
+            buffer = []
+            cursor = checkpoint
+            for _ in range(remaining):
+                buffer.append(cursor)
+                cursor = cursor.get_next()
+            yield from reversed(buffer)
+            remaining = segment
+
+    def reverse_list_stations(self) -> list[str]:
+        """Returns a Python list of the station names from tail to head."""
+        return [station.get_name() for station in reversed(self)]
+
+    def get_name(self) -> str:
+        """Returns the name of the line."""
+        return self._name
 
     def count_stations(self) -> int:
         """Returns the number of train stations in the line. Because the count is a
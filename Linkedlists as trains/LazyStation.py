@@ -0,0 +1,39 @@
+from __future__ import annotations
+from Station import Station
+
+
+class LazyStation(Station):
+
+    """A station loaded from a snapshot file (see LineSnapshot). Its name and
+    its next station are read from the file only the first time they are
+    asked for, so loading a line does not build every station up front. Once
+    set_next() is called, the station behaves like any other Station."""
+
+    __slots__ = ("_snapshot", "_slot")
+
+    # Marker for a field that has not been read from the snapshot yet
+    _UNREAD = object()
+
+    def __init__(self, snapshot: "LineSnapshot", slot: int) -> None:
+        """Creates the station at position slot of the snapshot, with its
+        name and next pointer still unread."""
+        super().__init__(self._UNREAD)
+        self._next = self._UNREAD
+        self._snapshot = snapshot
+        self._slot = slot
+
+    def get_next(self) -> "Station" | None:
+        """Accessor for next station, materialized on first use."""
+        if self._next is self._UNREAD:
+            self._next = self._snapshot.station(self._snapshot.next_of(self._slot))
+        return self._next
+
+    def get_name(self) -> str:
+        """Accessor for the name of the station, decoded on first use."""
+        if self._name is self._UNREAD:
+            self._name = self._snapshot.name_of(self._slot)
+        return self._name
+
+    def has_next(self) -> bool:
+        """Predicate accessor for next station"""
+        return self.get_next() is not None
@@ -0,0 +1,122 @@
+from __future__ import annotations
+import mmap
+import struct
+from array import array
+from typing import Iterable
+from LazyStation import LazyStation
+
+# 1234567890123456789012345678901234567890123456789012345678901234567890123456789
+
+
+class LineSnapshot:
+
+    """A read-only, memory-mapped train line file. The file holds:
+
+      - a header: magic bytes, station count, head slot, tail slot and the
+        length of the line name
+      - the line name, padded to a multiple of 4 bytes
+      - an int32 column of count + 1 offsets into the string table
+      - an int32 column with the slot of each station's next station (-1
+        for None)
+      - the string table: all station names, UTF-8 encoded, back to back
+
+    The int32 columns use the byte order of the machine that wrote them.
+    Opening a snapshot only reads the header; stations are created, as
+    LazyStation objects, when a traversal reaches them."""
+
+    _MAGIC = b"ETL1"
+    # magic, count, head slot, tail slot, length of the line name
+    _HEADER = struct.Struct("<4siiiI")
+    _NONE = -1
+
+    def __init__(self, path: str) -> None:
+        """Maps the snapshot file into memory and locates its columns."""
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, head, tail, name_length = self._HEADER.unpack_from(self._map)
+        if magic != self._MAGIC:
+            raise ValueError(f"{path} is not a train line snapshot")
+        self.count: int = count
+        self.head: int = head
+        self.tail: int = tail
+        position = self._HEADER.size
+        self.name: str = self._map[position:position + name_length].decode()
+        position += self._padded(name_length)
+        # Zero-copy int views over the two columns
+        view = memoryview(self._map)
+        self._offsets = view[position:position + 4 * (count + 1)].cast("i")
+        position += 4 * (count + 1)
+        self._next = view[position:position + 4 * count].cast("i")
+        self._strings: int = position + 4 * count
+        # The head and tail stations, by slot. The line holds on to these two,
+        # so a traversal must reach the very same objects. Every other slot is
+        # reached only from the station before it, which keeps its next
+        # station, so those need no cache and are freed once unreachable.
+        self._ends: dict[int, LazyStation] = {}
+
+    @staticmethod
+    def _padded(length: int) -> int:
+        """Rounds length up to a multiple of 4 so the int columns are aligned."""
+        return (length + 3) // 4 * 4
+
+    @classmethod
+    def write(cls, path: str, name: str, names: Iterable[str],
+              count: int) -> None:
+        """Writes a snapshot of a line with the given name whose count
+        stations, in order, have the given names. The names are streamed:
+        room is left for the two int columns, each name is encoded and
+        written as it comes, and only the int32 offsets are kept, to fill the
+        room at the end. Raises ValueError if the number of names is not
+        count."""
+        line_name = name.encode()
+        columns = cls._HEADER.size + cls._padded(len(line_name))
+        strings = columns + 4 * (count + 1) + 4 * count
+        # Stations are written in line order, so slot i is followed by i + 1.
+        next_slots = array("i", range(1, count + 1))
+        head = cls._NONE
+        tail = cls._NONE
+        if count > 0:
+            next_slots[-1] = cls._NONE
+            head = 0
+            tail = count - 1
+        offsets = array("i", [0])
+        with open(path, "wb") as file:
+            file.write(cls._HEADER.pack(cls._MAGIC, count, head, tail,
+                                        len(line_name)))
+            file.write(line_name.ljust(cls._padded(len(line_name)), b"\0"))
+            file.seek(strings)
+            for station in names:
+                encoded = station.encode()
+                file.write(encoded)
+                offsets.append(offsets[-1] + len(encoded))
+            if len(offsets) != count + 1:
+                raise ValueError(f"expected {count} station names, "
+                                 f"got {len(offsets) - 1}")
+            file.seek(columns)
+            file.write(offsets.tobytes())
+            file.write(next_slots.tobytes())
+
+    def station(self, slot: int) -> "LazyStation" | None:
+        """Returns a station for the given slot, or None for slot -1. The head
+        and tail slots always give the same object; other slots give a new one
+        each time, which is fine because each of them is asked for once, by
+        the station before it."""
+        station = None
+        if slot != self._NONE and slot != self.head and slot != self.tail:
+            station = LazyStation(self, slot)
+        elif slot != self._NONE:
+            station = self._ends.get(slot)
+            if station is None:
+                station = LazyStation(self, slot)
+                self._ends[slot] = station
+        return station
+
+    def name_of(self, slot: int) -> str:
+        """Decodes the name of the station at the given slot."""
+        start = self._strings + self._offsets[slot]
+        end = self._strings + self._offsets[slot + 1]
+        return self._map[start:end].decode()
+
+    def next_of(self, slot: int) -> int:
+        """Returns the slot of the station after the given one, or -1."""
+        return self._next[slot]
@@ -0,0 +1,263 @@
+from __future__ import annotations
+import random
+from itertools import count
+from typing import Iterator
+from ABCBasicTrainLine import ABCBasicTrainLine
+from ABCAdvancedTrainLine import ABCAdvanvedTrainLine
+from ABCSuperiorTrainLine import ABCSuperiorTrainLine
+from Station import Station
+
+# 1234567890123456789012345678901234567890123456789012345678901234567890123456789
+
+
+class _TreeNode:
+
+    """A node of a persistent treap. Nodes are never changed after they are
+    created, so any number of line versions can share them. In the tree of a
+    line, the in-order sequence of the nodes is the order of the stations,
+    and _size counts the stations in the subtree, which gives positions. In
+    the tree of names, the same kind of nodes is ordered by (name, ticket)."""
+
+    __slots__ = ("_ticket", "_name", "_priority", "_size", "_left", "_right")
+
+    def __init__(self, ticket: int, name: str, priority: float,
+                 left: "_TreeNode" | None, right: "_TreeNode" | None) -> None:
+        self._ticket = ticket
+        self._name = name
+        self._priority = priority
+        self._left = left
+        self._right = right
+        self._size = 1 + _size(left) + _size(right)
+
+    def _with(self, left: "_TreeNode" | None,
+              right: "_TreeNode" | None) -> "_TreeNode":
+        """Returns a copy of this node with different children."""
+        return _TreeNode(self._ticket, self._name, self._priority, left, right)
+
+
+def _size(node: "_TreeNode" | None) -> int:
+    """Number of stations in a subtree; 0 for an empty one."""
+    return 0 if node is None else node._size
+
+
+def _merge(first: "_TreeNode" | None,
+           second: "_TreeNode" | None) -> "_TreeNode" | None:
+    """Returns a tree with the stations of first followed by those of second.
+    Only the nodes along one path are copied."""
+    merged = first if second is None else second
+    if first is not None and second is not None:
+        if first._priority > second._priority:
+            merged = first._with(first._left, _merge(first._right, second))
+        else:
+            merged = second._with(_merge(first, second._left), second._right)
+    return merged
+
+
+def _split(node: "_TreeNode" | None,
+           k: int) -> tuple["_TreeNode" | None, "_TreeNode" | None]:
+    """Returns two trees: the first k stations and the rest. Only the nodes
+    along one path are copied."""
+    halves = (None, None)
+    if node is not None:
+        if _size(node._left) >= k:
+            left, right = _split(node._left, k)
+            halves = (left, node._with(right, node._right))
+        else:
+            left, right = _split(node._right, k - _size(node._left) - 1)
+            halves = (node._with(node._left, left), right)
+    return halves
+
+
+def _split_key(node: "_TreeNode" | None, name: str,
+               ticket: int) -> tuple["_TreeNode" | None, "_TreeNode" | None]:
+    """Splits a tree of names into the nodes before (name, ticket) and the
+    rest. Only the nodes along one path are copied."""
+    halves = (None, None)
+    if node is not None:
+        if (name, ticket) <= (node._name, node._ticket):
+            left, right = _split_key(node._left, name, ticket)
+            halves = (left, node._with(right, node._right))
+        else:
+            left, right = _split_key(node._right, name, ticket)
+            halves = (node._with(node._left, left), right)
+    return halves
+
+
+class PersistentTrainLine(ABCBasicTrainLine, ABCAdvanvedTrainLine,
+                          ABCSuperiorTrainLine):
+
+    """A train line whose stations live in a persistent (immutable) balanced
+    tree. Changing the line builds a new tree that shares all but O(log n)
+    nodes with the old one, so snapshot() is O(1): the snapshot simply keeps
+    the old tree, and nothing a writer does later can change it.
+
+    Every station added gets a ticket from a counter shared by the line and
+    all its snapshots. Stations are only ever appended, so tickets grow from
+    head to tail in every version, and the tree is also a search tree on
+    tickets. Each version also has a second persistent tree holding its
+    stations ordered by (name, ticket), changed along with the first one.
+    index_of() finds the smallest ticket for a name in that tree and its
+    position in the first one, both in O(log n)."""
+
+    _SINGULAR = "station"
+    _PLURAL = _SINGULAR + "s"
+    _EMPTY = _PLURAL
+
+    def __init__(self, name: str) -> None:
+        """Constructor to set the name of the trainline object, with empty
+        trees and a fresh ticket counter."""
+        self._name = name
+        self._root: "_TreeNode" | None = None
+        self._names_root: "_TreeNode" | None = None
+        self._tickets = count()
+
+    def snapshot(self) -> "PersistentTrainLine":
+        """Returns an independent version of the line as it is now, in O(1).
+        Later changes to either version do not affect the other."""
+        copy = PersistentTrainLine(self._name)
+        copy._root = self._root
+        copy._names_root = self._names_root
+        copy._tickets = self._tickets
+        return copy
+
+    def add(self, new_station: "Station" | str) -> None:
+        """Appends a station in O(log n) expected time."""
+        if isinstance(new_station, Station):
+            new_station = new_station.get_name()
+        ticket = next(self._tickets)
+        node = _TreeNode(ticket, new_station, random.random(), None, None)
+        self._root = _merge(self._root, node)
+        # Tickets only grow, so the new key goes after those of the same name.
+        before, after = _split_key(self._names_root, new_station, ticket)
+        entry = _TreeNode(ticket, new_station, random.random(), None, None)
+        self._names_root = _merge(_merge(before, entry), after)
+
+    def count_stations(self) -> int:
+        """Returns the number of train stations in the line (root size)."""
+        return _size(self._root)
+
+    def _node_at(self, index: int) -> "_TreeNode":
+        """Returns the tree node of the station at the given position."""
+        node = self._root
+        while index != _size(node._left):
+            if index < _size(node._left):
+                node = node._left
+            else:
+                index -= _size(node._left) + 1
+                node = node._right
+        return node
+
+    def _rank(self, ticket: int) -> int:
+        """Returns the position of the station with the given ticket, or -1
+        if this version does not have it. Tickets grow from head to tail, so
+        the tree is searched like a binary search tree."""
+        rank = -1
+        passed = 0
+        node = self._root
+        while node is not None and rank == -1:
+            if ticket < node._ticket:
+                node = node._left
+            elif ticket > node._ticket:
+                passed += _size(node._left) + 1
+                node = node._right
+            else:
+                rank = passed + _size(node._left)
+        return rank
+
+    def list_stations(self) -> list[str]:
+        """Returns the station names from head to tail."""
+        return list(self.iter_names())
+
+    def reverse_list_stations(self) -> list[str]:
+        """Returns the station names from tail to head."""
+        names = self.list_stations()
+        names.reverse()
+        return names
+
+    def __iter__(self) -> Iterator["Station"]:
+        """Yields the stations in order, as new, detached Station objects.
+        iter_names() is faster when only names are needed."""
+        for name in self.iter_names():
+            yield Station(name)
+
+    def iter_names(self) -> Iterator[str]:
+        """Yields the station names in order, with an explicit stack for the
+        in-order traversal. The tree never changes, so a snapshot can be
+        iterated while the line is being modified."""
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node._left
+            else:
+                node = stack.pop()
+                yield node._name
+                node = node._right
+
+    def find_middle(self) -> "Station" | None:
+        """Returns the middle station (the first of two for an even count), or
+        None for an empty line, in O(log n)."""
+        middle = None
+        if self._root is not None:
+            middle = Station(self._node_at((self._root._size - 1) // 2)._name)
+        return middle
+
+    def delete(self, index: int) -> "Station":
+        """Removes and returns the station at the given position, in O(log n)
+        expected time, by splitting the tree around it and merging the two
+        remaining parts."""
+        if index < 0 or index >= self.count_stations():
+            raise IndexError(f"Station index {index} out of range")
+        before, rest = _split(self._root, index)
+        removed, after = _split(rest, 1)
+        self._root = _merge(before, after)
+        # Drop the station's (name, ticket) key from the tree of names too.
+        before, rest = _split_key(self._names_root, removed._name, removed._ticket)
+        _, after = _split(rest, 1)
+        self._names_root = _merge(before, after)
+        return Station(removed._name)
+
+    def index_of(self, name: str) -> int:
+        """Returns the position of the first station with the given name, or
+        -1 if there is no such station, in O(log n): the smallest key of that
+        name in the tree of names gives the first station's ticket."""
+        first = None
+        node = self._names_root
+        while node is not None:
+            if node._name >= name:
+                first = node
+                node = node._left
+            else:
+                node = node._right
+        index = -1
+        if first is not None and first._name == name:
+            index = self._rank(first._ticket)
+        return index
+
+    def exists(self, name: str) -> bool:
+        """Returns True iff a station with the given name is on the line."""
+        return self.index_of(name) != -1
+
+    def has_loop(self) -> bool:
+        """Always False: tree nodes are immutable and only ever point to
+        nodes created before them, so they cannot form a cycle."""
+        return False
+
+    def __len__(self) -> int:
+        """Overloading len to use local metric."""
+        return self.count_stations()
+
+    def __str__(self) -> str:
+        """Textual representation."""
+        stations = self.count_stations()
+        if stations == 0:
+            textual = self._EMPTY
+        elif stations == 1:
+            textual = self._SINGULAR
+        else:
+            textual = self._PLURAL
+        return f"{self._name} has {stations} {textual}"
+
+    def __bool__(self) -> bool:
+        return self._root is not None
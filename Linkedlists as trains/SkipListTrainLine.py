@@ -0,0 +1,240 @@
+from __future__ import annotations
+import random
+from itertools import count
+from AmericanTrainLine import AmericanTrainLine
+from EuropeanTrainLine import EuropeanTrainLine
+from Station import Station
+
+# 1234567890123456789012345678901234567890123456789012345678901234567890123456789
+
+
+class _SkipNode:
+
+    """A tower of the skip list, standing on one station. _forward[level] is
+    the next tower tall enough to reach that level, and _width[level] is how
+    many stations that pointer jumps over. Serials grow from head to tail."""
+
+    __slots__ = ("_station", "_serial", "_forward", "_width")
+
+    def __init__(self, station: "Station" | None, serial: int,
+                 height: int) -> None:
+        self._station = station
+        self._serial = serial
+        self._forward: list["_SkipNode" | None] = [None] * height
+        self._width: list[int] = [0] * height
+
+
+class SkipListTrainLine(EuropeanTrainLine):
+
+    """A EuropeanTrainLine with an indexable skip list over its stations.
+    Every station gets a tower of random height, and the towers are linked
+    level by level with pointers that remember how many stations they span.
+    Walking down the levels finds any position in O(log n) expected steps,
+    so station_at(index) and delete(index) no longer walk the chain, and
+    index_of() turns a name-index hit into a position in O(log n).
+
+    Appending stays O(1) expected: the last tower of every level is kept,
+    so a new tower is linked without searching. Loading a snapshot, upgrading
+    an American line and splitting a line rebuild the towers, which walks
+    the whole line."""
+
+    _MAX_LEVEL = 32
+
+    def __init__(self, name: str, indexed: bool = False) -> None:
+        """Constructor to set the name of the trainline object, with an empty
+        skip list."""
+        super().__init__(name, indexed)
+        self._clear_skip_list()
+
+    def _clear_skip_list(self) -> None:
+        """Resets the skip list to a lone sentinel tower at position -1."""
+        self._sentinel = _SkipNode(None, -1, self._MAX_LEVEL)
+        # Levels in use, i.e., the height of the tallest tower
+        self._levels = 1
+        # Last tower of every level and its position, for O(1) appends
+        self._last: list[_SkipNode] = [self._sentinel] * self._MAX_LEVEL
+        self._last_position: list[int] = [-1] * self._MAX_LEVEL
+        self._towers: dict["Station", _SkipNode] = {}
+        self._serials = count()
+
+    def _rebuild_skip_list(self) -> None:
+        """Builds the towers from scratch by walking the line once."""
+        self._clear_skip_list()
+        for position, station in enumerate(self):
+            self._raise_tower(station, position)
+
+    def _raise_tower(self, station: "Station", position: int) -> None:
+        """Adds a tower for a station just appended at the given position.
+        Each level is reached with probability 1/2 of the one below."""
+        height = 1
+        while height < self._MAX_LEVEL and random.random() < 0.5:
+            height += 1
+        self._levels = max(self._levels, height)
+        tower = _SkipNode(station, next(self._serials), height)
+        for level in range(height):
+            last = self._last[level]
+            last._forward[level] = tower
+            last._width[level] = position - self._last_position[level]
+            self._last[level] = tower
+            self._last_position[level] = position
+        self._towers[station] = tower
+
+    @classmethod
+    def load(cls, path: str, indexed: bool = False) -> "SkipListTrainLine":
+        """Loads a line written by save() and builds its skip list."""
+        line = super().load(path, indexed)
+        line._rebuild_skip_list()
+        return line
+
+    @classmethod
+    def from_american(cls, line: AmericanTrainLine,
+                      indexed: bool = False) -> "SkipListTrainLine":
+        """Upgrades an AmericanTrainLine and builds its skip list."""
+        upgraded = super().from_american(line, indexed)
+        upgraded._rebuild_skip_list()
+        return upgraded
+
+    def add(self, new_station: "Station" | str) -> None:
+        """Adds a new station to the end of the line and raises its tower."""
+        super().add(new_station)
+        self._raise_tower(self._tail, self._count - 1)
+
+    def _attach(self, first: "Station" | None, last: "Station" | None,
+                added: int) -> None:
+        """Attaches a chain of stations after the tail and raises a tower for
+        each of them."""
+        super()._attach(first, last, added)
+        cursor = first
+        for position in range(self._count - added, self._count):
+            self._raise_tower(cursor, position)
+            cursor = cursor.get_next()
+
+    def _predecessors(self, index: int) -> tuple[list[_SkipNode], list[int]]:
+        """Returns, for every level in use, the last tower before the given
+        position, and the positions of those towers."""
+        update = [self._sentinel] * self._levels
+        positions = [-1] * self._levels
+        tower = self._sentinel
+        position = -1
+        for level in reversed(range(self._levels)):
+            while (tower._forward[level] is not None
+                   and position + tower._width[level] < index):
+                position += tower._width[level]
+                tower = tower._forward[level]
+            update[level] = tower
+            positions[level] = position
+        return update, positions
+
+    def station_at(self, index: int) -> "Station":
+        """Returns the station at the given position in O(log n) expected.
+        Raises IndexError if the position is not on the line."""
+        if index < 0 or index >= self._count:
+            raise IndexError(f"Station index {index} out of range")
+        tower = self._sentinel
+        position = -1
+        for level in reversed(range(self._levels)):
+            while (tower._forward[level] is not None
+                   and position + tower._width[level] <= index):
+                position += tower._width[level]
+                tower = tower._forward[level]
+        return tower._station
+
+    def delete(self, index: int) -> "Station":
+        """Removes and returns the station at the given position. The
+        predecessors at every level are found in O(log n) expected, and the
+        pointers that jumped over the station are shortened by one."""
+        if index < 0 or index >= self._count:
+            raise IndexError(f"Station index {index} out of range")
+        update, positions = self._predecessors(index)
+        target = update[0]._forward[0]
+        for level in range(self._levels):
+            before = update[level]
+            if before._forward[level] is target:
+                # The pointer lands on the removed tower: jump past it.
+                before._forward[level] = target._forward[level]
+                before._width[level] += target._width[level] - 1
+            elif before._forward[level] is not None:
+                # The pointer jumps over the removed station.
+                before._width[level] -= 1
+            if self._last[level] is target:
+                self._last[level] = before
+                self._last_position[level] = positions[level]
+            elif self._last_position[level] > index:
+                self._last_position[level] -= 1
+        removed = target._station
+        del self._towers[removed]
+        # Unlink the station from the chain, as EuropeanTrainLine does.
+        previous = update[0]._station
+        if previous is None:
+            self._head = removed.get_next()
+        else:
+            previous.set_next(removed.get_next())
+        if removed is self._tail:
+            self._tail = previous
+        removed.set_next(None)
+        self._count -= 1
+        self._middle = None
+        if self._count > 0:
+            self._middle = self.station_at((self._count - 1) // 2)
+        if self._index is not None:
+            self._unindex_station(removed)
+        return removed
+
+    def position_of(self, station: "Station") -> int:
+        """Returns the position of a station of this line in O(log n)
+        expected, by searching the towers for its serial."""
+        serial = self._towers[station]._serial
+        tower = self._sentinel
+        position = -1
+        for level in reversed(range(self._levels)):
+            while (tower._forward[level] is not None
+                   and tower._forward[level]._serial <= serial):
+                position += tower._width[level]
+                tower = tower._forward[level]
+        return position
+
+    def index_of(self, name: str) -> int:
+        """Returns the position of the first station with the given name, or
+        -1. With the name index, the first station with that name is found in
+        the index and its position comes from the skip list."""
+        if self._index is not None:
+            entries = self._index.get(name)
+            index = self.position_of(next(iter(entries))) if entries else -1
+        else:
+            index = super().index_of(name)
+        return index
+
+    def split_at_middle(self, name: str) -> "SkipListTrainLine":
+        """Cuts the line after its middle station and rebuilds the skip lists
+        of both halves, which walks them."""
+        second = super().split_at_middle(name)
+        self._rebuild_skip_list()
+        second._rebuild_skip_list()
+        return second
+
+
+# --- Benchmark: positional access and deletes against the chain walk ---
+if __name__ == "__main__":
+    import time
+
+    N = 100_000
+    OPERATIONS = 1_000
+    names = [f"Station {i}" for i in range(N)]
+    random.seed(271)
+    positions = [random.randrange(N - OPERATIONS) for _ in range(OPERATIONS)]
+
+    for line_class in (EuropeanTrainLine, SkipListTrainLine):
+        line = line_class.from_names("Benchmark", names, indexed=True)
+        start = time.perf_counter()
+        for position in positions:
+            line.delete(position)
+        deleted = time.perf_counter() - start
+        start = time.perf_counter()
+        for position in positions:
+            if line_class is SkipListTrainLine:
+                line.station_at(position)
+            else:
+                next(line.view(position))
+        accessed = time.perf_counter() - start
+        print(f"{line_class.__name__:>18}: {OPERATIONS} deletes {deleted:.3f}s, "
+              f"{OPERATIONS} positional reads {accessed:.3f}s")
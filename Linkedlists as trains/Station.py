@@ -1,5 +1,12 @@
+from __future__ import annotations
+
+
 class Station:
 
+    # Declaring the attributes up front means Python does not give every
+    # station its own __dict__, which saves a lot of memory on long lines.
+    __slots__ = ("_name", "_next")
+
     def __init__(self, name: str) -> None:
         """ Partial constructor. New stations are created with their next
         pointer set to None. The pointer is updated by the user."""
@@ -0,0 +1,219 @@
+from __future__ import annotations
+from array import array
+from ABCBasicTrainLine import ABCBasicTrainLine
+from ABCAdvancedTrainLine import ABCAdvanvedTrainLine
+from Station import Station
+
+# 1234567890123456789012345678901234567890123456789012345678901234567890123456789
+
+
+class StationArena(ABCBasicTrainLine, ABCAdvanvedTrainLine):
+
+    """A train line that does not create a Station object per station. Instead,
+    the line keeps two parallel columns: one with the station names and one
+    with the position of the next station. A station is simply an int index
+    into these columns, and the int -1 plays the role of None. Slots released
+    by delete() are kept in a free list and reused by later additions."""
+
+    _SINGULAR = "station"
+    _PLURAL = _SINGULAR + "s"
+    _EMPTY = _PLURAL
+    # Int link that means "no next station", the arena version of None
+    _NONE = -1
+    # Signed 64-bit ints for the next column
+    _TYPECODE = "q"
+
+    def __init__(self, name: str) -> None:
+        """Constructor to set the name of the trainline object and prepare its
+        empty storage columns."""
+        self._name = name
+        # Column of station names; _names[i] is the name of station i
+        self._names: list[str | None] = []
+        # Column of next links; _next[i] is the index of the station after i
+        self._next: array = array(self._TYPECODE)
+        # Indices of slots freed by delete(), ready to be reused
+        self._free: list[int] = []
+        self._head: int = self._NONE
+        self._tail: int = self._NONE
+        self._count: int = 0
+
+    def _allocate(self, name: str) -> int:
+        """Returns the index of a slot holding the given name and no next
+        station. A freed slot is reused when there is one, otherwise the
+        columns grow by one."""
+        if self._free:
+            slot = self._free.pop()
+            self._names[slot] = name
+            self._next[slot] = self._NONE
+        else:
+            slot = len(self._names)
+            self._names.append(name)
+            self._next.append(self._NONE)
+        return slot
+
+    def _station_at(self, slot: int) -> "Station":
+        """Materializes a detached Station object for the given slot. Used by
+        the methods whose contract requires a Station to be returned."""
+        return Station(self._names[slot])
+
+    def add(self, new_station: "Station" | str) -> None:
+        """Adds a new station to the end of the line. Like EuropeanTrainLine,
+        the method accepts string or station objects. Only the name of a
+        Station object is stored."""
+        if isinstance(new_station, Station):
+            new_station = new_station.get_name()
+        slot = self._allocate(new_station)
+        if self._head == self._NONE:
+            # The line is empty. The new station becomes its first (head).
+            self._head = slot
+        else:
+            # Link the current tail to the new station.
+            self._next[self._tail] = slot
+        self._tail = slot
+        self._count += 1
+
+    def count_stations(self) -> int:
+        """Returns the number of train stations in the line (cached)."""
+        return self._count
+
+    def list_stations(self) -> list[str]:
+        """Returns the station names from head to tail."""
+        names = []
+        cursor = self._head
+        while cursor != self._NONE:
+            names.append(self._names[cursor])
+            cursor = self._next[cursor]
+        return names
+
+    def find_middle(self) -> "Station" | None:
+        """Returns the middle station using the fast/slow cursor method, with
+        int links instead of pointers. For an even number of stations, the
+        first of the two middle stations is returned."""
+        middle = None
+        if self._head != self._NONE:
+            slow = self._head
+            fast = self._head
+            while (self._next[fast] != self._NONE
+                   and self._next[self._next[fast]] != self._NONE):
+                slow = self._next[slow]
+                fast = self._next[self._next[fast]]
+            middle = self._station_at(slow)
+        return middle
+
+    def delete(self, index: int) -> "Station":
+        """Removes and returns the station at the given position. The slot of
+        the removed station goes to the free list for reuse."""
+        if index < 0 or index >= self._count:
+            raise IndexError(f"Station index {index} out of range")
+        if index == 0:
+            # Removing the head: the next station becomes the head.
+            removed = self._head
+            self._head = self._next[removed]
+            previous = self._NONE
+        else:
+            # Find the station just before the one to remove.
+            previous = self._head
+            for _ in range(index - 1):
+                previous = self._next[previous]
+            removed = self._next[previous]
+            # Bypass the removed station.
+            self._next[previous] = self._next[removed]
+        if removed == self._tail:
+            # The station before the removed one is now the last.
+            self._tail = previous
+        station = self._station_at(removed)
+        # Release the slot: drop the name so it can be garbage collected.
+        self._names[removed] = None
+        self._next[removed] = self._NONE
+        self._free.append(removed)
+        self._count -= 1
+        return station
+
+    def index_of(self, name: str) -> int:
+        """Returns the position of the first station with the given name, or
+        -1 if there is no such station."""
+        index = -1
+        position = 0
+        cursor = self._head
+        while cursor != self._NONE and index == -1:
+            if self._names[cursor] == name:
+                index = position
+            cursor = self._next[cursor]
+            position += 1
+        return index
+
+    def exists(self, name: str) -> bool:
+        """Returns True iff a station with the given name is on the line."""
+        return self.index_of(name) != -1
+
+    def has_loop(self) -> bool:
+        """Floyd's cycle-finding algorithm over the int links."""
+        loop = False
+        slow = self._head
+        fast = self._head
+        while (not loop and fast != self._NONE
+               and self._next[fast] != self._NONE):
+            slow = self._next[slow]
+            fast = self._next[self._next[fast]]
+            loop = fast == slow
+        return loop
+
+    def __len__(self) -> int:
+        """Overloading len to use local metric."""
+        return self.count_stations()
+
+    def __str__(self) -> str:
+        """Textual representation."""
+        if self._count == 0:
+            textual = self._EMPTY
+        elif self._count == 1:
+            textual = self._SINGULAR
+        else:
+            textual = self._PLURAL
+        return f"{self._name} has {self._count} {textual}"
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+
+# --- Memory and throughput comparison with Station objects ---
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+    from EuropeanTrainLine import EuropeanTrainLine
+
+    def walk_stations(line: EuropeanTrainLine) -> list[str]:
+        """Station-object counterpart of StationArena.list_stations."""
+        names = []
+        cursor = line._head
+        while cursor is not None:
+            names.append(cursor.get_name())
+            cursor = cursor.get_next()
+        return names
+
+    N = 1_000_000
+    names = [f"Station {i}" for i in range(N)]
+
+    def build(line_class: type) -> EuropeanTrainLine | StationArena:
+        line = line_class("Benchmark")
+        for name in names:
+            line.add(name)
+        return line
+
+    for line_class, traverse in ((EuropeanTrainLine, walk_stations),
+                                 (StationArena, StationArena.list_stations)):
+        # Memory and time come from separate runs: tracing allocations slows
+        # the build down several times over.
+        tracemalloc.start()
+        line = build(line_class)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del line
+        start = time.perf_counter()
+        line = build(line_class)
+        built = time.perf_counter() - start
+        start = time.perf_counter()
+        traverse(line)
+        listed = time.perf_counter() - start
+        print(f"{line_class.__name__:>18}: {memory / N:6.1f} bytes/station, "
+              f"build {built:.3f}s, traverse {listed:.3f}s")
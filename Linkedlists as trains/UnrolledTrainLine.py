@@ -0,0 +1,248 @@
+from __future__ import annotations
+from typing import Iterator
+from ABCBasicTrainLine import ABCBasicTrainLine
+from ABCAdvancedTrainLine import ABCAdvanvedTrainLine
+from ABCSuperiorTrainLine import ABCSuperiorTrainLine
+from Station import Station
+
+# 1234567890123456789012345678901234567890123456789012345678901234567890123456789
+
+
+class _Chunk:
+
+    """A node of the unrolled line: a fixed-size block of station names with
+    a single pointer to the next block. Only the first _size slots are used."""
+
+    __slots__ = ("_names", "_size", "_next")
+
+    def __init__(self, capacity: int) -> None:
+        self._names: list[str | None] = [None] * capacity
+        self._size: int = 0
+        self._next: "_Chunk" | None = None
+
+
+class UnrolledTrainLine(ABCBasicTrainLine, ABCAdvanvedTrainLine,
+                        ABCSuperiorTrainLine):
+
+    """A train line whose nodes hold up to chunk_size station names each,
+    instead of one station per node. Traversals follow one pointer per chunk
+    and scan the names inside a chunk with Python's fast list operations, so
+    they run several times faster than on a line of Station objects, and the
+    per-station cost of a node object is shared by a whole chunk. Stations
+    are represented by their names; methods whose contract returns a Station
+    return a new, detached Station with that name."""
+
+    _SINGULAR = "station"
+    _PLURAL = _SINGULAR + "s"
+    _EMPTY = _PLURAL
+    _DEFAULT_CHUNK_SIZE = 32
+
+    def __init__(self, name: str, chunk_size: int = _DEFAULT_CHUNK_SIZE) -> None:
+        """Constructor to set the name of the trainline object and how many
+        stations fit in a single chunk."""
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self._name = name
+        self._chunk_size: int = chunk_size
+        self._head: "_Chunk" | None = None
+        self._tail: "_Chunk" | None = None
+        self._count: int = 0
+
+    def add(self, new_station: "Station" | str) -> None:
+        """Adds a new station to the end of the line. A new chunk is created
+        only when the last chunk is full."""
+        if isinstance(new_station, Station):
+            new_station = new_station.get_name()
+        if self._tail is None or self._tail._size == self._chunk_size:
+            chunk = _Chunk(self._chunk_size)
+            if self._tail is None:
+                self._head = chunk
+            else:
+                self._tail._next = chunk
+            self._tail = chunk
+        self._tail._names[self._tail._size] = new_station
+        self._tail._size += 1
+        self._count += 1
+
+    def count_stations(self) -> int:
+        """Returns the number of train stations in the line (cached)."""
+        return self._count
+
+    def list_stations(self) -> list[str]:
+        """Returns the station names from head to tail, copying a whole chunk
+        at a time."""
+        names = []
+        chunk = self._head
+        while chunk is not None:
+            names.extend(chunk._names[:chunk._size])
+            chunk = chunk._next
+        return names
+
+    def reverse_list_stations(self) -> list[str]:
+        """Returns the station names from tail to head."""
+        names = self.list_stations()
+        names.reverse()
+        return names
+
+    def __iter__(self) -> Iterator["Station"]:
+        """Yields the stations in order of appearance, as new, detached
+        Station objects. iter_names() is faster when only names are needed."""
+        for name in self.iter_names():
+            yield Station(name)
+
+    def iter_names(self) -> Iterator[str]:
+        """Yields the station names in order of appearance, a whole chunk at
+        a time."""
+        chunk = self._head
+        while chunk is not None:
+            yield from chunk._names[:chunk._size]
+            chunk = chunk._next
+
+    def _locate(self, index: int) -> tuple["_Chunk", "_Chunk" | None, int]:
+        """Returns the chunk holding the station at the given position, the
+        chunk before it (None for the head chunk), and the offset of the
+        station inside its chunk. Whole chunks are skipped using their size."""
+        previous = None
+        chunk = self._head
+        while index >= chunk._size:
+            index -= chunk._size
+            previous = chunk
+            chunk = chunk._next
+        return chunk, previous, index
+
+    def find_middle(self) -> "Station" | None:
+        """Returns the middle station, or None for an empty line. With an even
+        number of stations, the first of the two middle stations is returned.
+        The count is cached, so the middle is found by skipping whole chunks
+        instead of running fast/slow cursors."""
+        middle = None
+        if self._count > 0:
+            chunk, _, offset = self._locate((self._count - 1) // 2)
+            middle = Station(chunk._names[offset])
+        return middle
+
+    def delete(self, index: int) -> "Station":
+        """Removes and returns the station at the given position. A chunk that
+        drops below half full is merged with the next chunk when the two fit
+        together, which keeps the chunks dense."""
+        if index < 0 or index >= self._count:
+            raise IndexError(f"Station index {index} out of range")
+        chunk, previous, offset = self._locate(index)
+        removed = chunk._names[offset]
+        # Shift the rest of the chunk one place left with a slice assignment.
+        chunk._names[offset:chunk._size - 1] = chunk._names[offset + 1:chunk._size]
+        chunk._size -= 1
+        chunk._names[chunk._size] = None
+        self._count -= 1
+        if chunk._size == 0:
+            # Unlink the empty chunk.
+            if previous is None:
+                self._head = chunk._next
+            else:
+                previous._next = chunk._next
+            if chunk is self._tail:
+                self._tail = previous
+        elif (chunk._size < self._chunk_size // 2 and chunk._next is not None
+              and chunk._size + chunk._next._size <= self._chunk_size):
+            # Pull the next chunk's names into this one and unlink it.
+            following = chunk._next
+            chunk._names[chunk._size:chunk._size + following._size] = \
+                following._names[:following._size]
+            chunk._size += following._size
+            chunk._next = following._next
+            if following is self._tail:
+                self._tail = chunk
+        return Station(removed)
+
+    def index_of(self, name: str) -> int:
+        """Returns the position of the first station with the given name, or
+        -1 if there is no such station. Each chunk is searched with the
+        built-in list.index."""
+        index = -1
+        position = 0
+        chunk = self._head
+        while chunk is not None and index == -1:
+            try:
+                index = position + chunk._names.index(name, 0, chunk._size)
+            except ValueError:
+                position += chunk._size
+                chunk = chunk._next
+        return index
+
+    def exists(self, name: str) -> bool:
+        """Returns True iff a station with the given name is on the line."""
+        return self.index_of(name) != -1
+
+    def has_loop(self) -> bool:
+        """Floyd's cycle-finding algorithm over the chunks."""
+        loop = False
+        slow = self._head
+        fast = self._head
+        while not loop and fast is not None and fast._next is not None:
+            slow = slow._next
+            fast = fast._next._next
+            loop = fast is slow
+        return loop
+
+    def __len__(self) -> int:
+        """Overloading len to use local metric."""
+        return self.count_stations()
+
+    def __str__(self) -> str:
+        """Textual representation."""
+        if self._count == 0:
+            textual = self._EMPTY
+        elif self._count == 1:
+            textual = self._SINGULAR
+        else:
+            textual = self._PLURAL
+        return f"{self._name} has {self._count} {textual}"
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+
+# --- Benchmark across chunk sizes, against a line of Station objects ---
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+    from EuropeanTrainLine import EuropeanTrainLine
+
+    def timed(task) -> float:
+        """Returns the seconds taken by task()."""
+        start = time.perf_counter()
+        task()
+        return time.perf_counter() - start
+
+    def walk_stations(line: EuropeanTrainLine) -> list[str]:
+        """Station-object counterpart of UnrolledTrainLine.list_stations."""
+        names = []
+        cursor = line._head
+        while cursor is not None:
+            names.append(cursor.get_name())
+            cursor = cursor.get_next()
+        return names
+
+    N = 1_000_000
+    names = [f"Station {i}" for i in range(N)]
+
+    tracemalloc.start()
+    line = EuropeanTrainLine.from_names("Benchmark", names)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{'Station objects':>16}: {memory / N:6.1f} bytes/station, "
+          f"list {timed(lambda: walk_stations(line)):.3f}s, "
+          f"iterate {timed(lambda: sum(1 for _ in line.iter_names())):.3f}s, "
+          f"index_of {timed(lambda: line.index_of('missing')):.3f}s")
+
+    for chunk_size in (1, 4, 16, 64, 256):
+        tracemalloc.start()
+        line = UnrolledTrainLine("Benchmark", chunk_size)
+        for name in names:
+            line.add(name)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{f'chunk size {chunk_size}':>16}: {memory / N:6.1f} bytes/station, "
+              f"list {timed(line.list_stations):.3f}s, "
+              f"iterate {timed(lambda: sum(1 for _ in line.iter_names())):.3f}s, "
+              f"index_of {timed(lambda: line.index_of('missing')):.3f}s")
@@ -0,0 +1,127 @@
+from SentinelDoublyLinkedList import SentinelDoublyLinkedList
+
+
+class LFUCache:
+    """A least-frequently-used cache with O(1) get, put and eviction. Entries
+    with the same use count share a bucket, a doubly linked list ordered from
+    most to least recently used. The buckets themselves sit in another
+    doubly linked list, in increasing order of use count, so the bucket to
+    evict from is always the first one, and an entry that is used again
+    moves to the next bucket, creating it if needed.
+
+    Capacity, weigher and on_evict work as in LRUCache. Ties between entries
+    used equally often are broken by evicting the least recently used."""
+
+    def __init__(self, capacity, weigher=None, on_evict=None):
+        self._capacity = capacity
+        self._weigher = weigher
+        self._on_evict = on_evict
+        self._nodes = {}
+        # Node data is a [count, entries] pair, lowest count first
+        self._buckets = SentinelDoublyLinkedList()
+        self._weight = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, key):
+        """Membership test; does not count as a use of the entry."""
+        return key in self._nodes
+
+    def _weigh(self, value):
+        return 1 if self._weigher is None else self._weigher(value)
+
+    def _touch(self, node):
+        """Moves an entry to the bucket for one more use. Entry data is a
+        [key, value, weight, bucket node] list."""
+        bucket = node.get_data()[3]
+        count, entries = bucket.get_data()
+        following = bucket.get_next()
+        if bucket is self._buckets.get_tail() or following.get_data()[0] != count + 1:
+            # No bucket for count + 1 yet: create it right after this one.
+            following = self._buckets.insert_after(
+                bucket, [count + 1, SentinelDoublyLinkedList()])
+        entries.transfer_to_front(node, following.get_data()[1])
+        node.get_data()[3] = following
+        if entries.is_empty():
+            self._buckets.remove(bucket)
+
+    def get(self, key, default=None):
+        """Returns the value for key and counts one more use of it, or returns
+        default if key is not cached."""
+        value = default
+        node = self._nodes.get(key)
+        if node is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            self._touch(node)
+            value = node.get_data()[1]
+        return value
+
+    def put(self, key, value):
+        """Caches value under key, counting one use, and evicts the least
+        frequently used entries until the weight fits. A new key makes room
+        before it is inserted: otherwise, when every other entry has been used
+        more than once, it would be alone in the lowest bucket and be evicted
+        straight away."""
+        weight = self._weigh(value)
+        node = self._nodes.get(key)
+        if node is None:
+            while self._nodes and self._weight + weight > self._capacity:
+                self._evict()
+            first = self._buckets.get_head()
+            if first is None or first.get_data()[0] != 1:
+                first = self._buckets.add_to_front([1, SentinelDoublyLinkedList()])
+            node = first.get_data()[1].add_to_front([key, value, weight, first])
+            self._nodes[key] = node
+        else:
+            entry = node.get_data()
+            self._weight -= entry[2]
+            entry[1] = value
+            entry[2] = weight
+            self._touch(node)
+        self._weight += weight
+        while self._weight > self._capacity:
+            self._evict()
+
+    def _evict(self):
+        """Evicts the least recently used entry of the lowest-count bucket."""
+        bucket = self._buckets.get_head()
+        entries = bucket.get_data()[1]
+        key, value, weight, _ = entries.remove(entries.get_tail())
+        if entries.is_empty():
+            self._buckets.remove(bucket)
+        del self._nodes[key]
+        self._weight -= weight
+        self._evictions += 1
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+
+    def stats(self):
+        """Returns the hit, miss and eviction counters, the number of entries
+        and their total weight."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "size": len(self._nodes),
+            "weight": self._weight,
+        }
+
+
+if __name__ == "__main__":
+    # A put followed by a get must hit, even when every other entry has been
+    # used more often than the new one.
+    evicted = []
+    cache = LFUCache(2, on_evict=lambda key, value: evicted.append(key))
+    cache.put("a", 1)
+    cache.get("a")
+    cache.put("b", 2)
+    cache.get("b")
+    cache.put("c", 3)
+    assert cache.get("c") == 3 and evicted == ["a"], evicted
+    print(cache.stats())
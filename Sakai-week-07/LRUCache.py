@@ -0,0 +1,122 @@
+from SentinelDoublyLinkedList import SentinelDoublyLinkedList
+
+
+class LRUCache:
+    """A least-recently-used cache: a dict from key to list node, and a
+    doubly linked list that keeps the entries from most to least recently
+    used. get() and put() move an entry to the front, and eviction takes
+    entries from the back, all in O(1).
+
+    The capacity is a total weight. By default every entry weighs 1, so the
+    capacity is a number of entries; a weigher function can give entries
+    other weights, e.g. their size in bytes. on_evict, if given, is called
+    with the key and value of every evicted entry."""
+
+    def __init__(self, capacity, weigher=None, on_evict=None):
+        self._capacity = capacity
+        self._weigher = weigher
+        self._on_evict = on_evict
+        self._nodes = {}
+        # Node data is a (key, value, weight) tuple, most recent first
+        self._order = SentinelDoublyLinkedList()
+        self._weight = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, key):
+        """Membership test; does not count as a use of the entry."""
+        return key in self._nodes
+
+    def _weigh(self, value):
+        return 1 if self._weigher is None else self._weigher(value)
+
+    def get(self, key, default=None):
+        """Returns the value for key and marks it most recently used, or
+        returns default if key is not cached."""
+        value = default
+        node = self._nodes.get(key)
+        if node is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            self._order.move_to_front(node)
+            value = node.get_data()[1]
+        return value
+
+    def put(self, key, value):
+        """Caches value under key as the most recently used entry, then
+        evicts least recently used entries until the weight fits."""
+        weight = self._weigh(value)
+        node = self._nodes.get(key)
+        if node is None:
+            self._nodes[key] = self._order.add_to_front((key, value, weight))
+        else:
+            self._weight -= node.get_data()[2]
+            node.set_data((key, value, weight))
+            self._order.move_to_front(node)
+        self._weight += weight
+        while self._weight > self._capacity:
+            self._evict(self._order.get_tail())
+
+    def _evict(self, node):
+        key, value, weight = self._order.remove(node)
+        del self._nodes[key]
+        self._weight -= weight
+        self._evictions += 1
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+
+    def stats(self):
+        """Returns the hit, miss and eviction counters, the number of entries
+        and their total weight."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "size": len(self._nodes),
+            "weight": self._weight,
+        }
+
+
+# --- Benchmark: Zipf-distributed trace against functools.lru_cache ---
+if __name__ == "__main__":
+    import random
+    import time
+    from functools import lru_cache
+    from itertools import accumulate
+    from LFUCache import LFUCache
+
+    KEYS = 100_000
+    TRACE = 500_000
+    CAPACITY = 2_000
+    random.seed(271)
+    for skew in (0.8, 1.0, 1.2):
+        zipf = list(accumulate(1 / rank ** skew for rank in range(1, KEYS + 1)))
+        trace = random.choices(range(KEYS), cum_weights=zipf, k=TRACE)
+
+        @lru_cache(maxsize=CAPACITY)
+        def lookup(key):
+            return key
+
+        start = time.perf_counter()
+        for key in trace:
+            lookup(key)
+        elapsed = time.perf_counter() - start
+        info = lookup.cache_info()
+        print(f"Zipf s={skew}   functools.lru_cache: "
+              f"hit rate {info.hits / TRACE:.3f}, {elapsed:.3f}s")
+
+        for cache_class in (LRUCache, LFUCache):
+            cache = cache_class(CAPACITY)
+            start = time.perf_counter()
+            for key in trace:
+                if cache.get(key) is None:
+                    cache.put(key, key)
+            elapsed = time.perf_counter() - start
+            stats = cache.stats()
+            print(f"Zipf s={skew} {cache_class.__name__:>20}: "
+                  f"hit rate {stats['hits'] / TRACE:.3f}, {elapsed:.3f}s")
@@ -1,5 +1,8 @@
 class Node:
 
+    # No per-node __dict__: lists of millions of nodes stay compact
+    __slots__ = ("data", "next", "prev")
+
     def __init__(self, data):
         self.data = data
         self.next = None
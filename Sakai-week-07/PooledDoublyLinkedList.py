@@ -0,0 +1,327 @@
+import math
+import random
+from array import array
+
+
+class PooledDoublyLinkedList:
+    """A doubly linked list without Node objects. The data, prev and next of
+    every node live in three parallel columns, and a node is just an int
+    index into them; -1 plays the role of None. Slots of removed nodes go
+    to a free list (chained through the next column) and are reused, and
+    when no slot is free the columns grow by a whole chunk at once. Adding
+    and removing nodes therefore creates no objects for the garbage
+    collector to track.
+
+    The methods of DoublyLinkedList up to positional access are here too:
+    find_middle, the loop and gap checks, verify and verify_sample, insert,
+    pop, __getitem__ and __setitem__, plus __len__ and __iter__. With no Node
+    objects to hand out, find_middle() returns the middle data, and verify()
+    reports positions. Positional access walks from the nearer end, without
+    the finger of DoublyLinkedList. find() and sort() are not provided."""
+
+    _NONE = -1
+    _CHUNK = 1024
+
+    def __init__(self):
+        self._data = []
+        self._prev = array("l")
+        self._next = array("l")
+        self._head = self._NONE
+        self._tail = self._NONE
+        self._size = 0
+        # First free slot; each free slot's next is the following free slot
+        self._free = self._NONE
+        self._chunks = 0
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __repr__(self):
+        return " <-> ".join(str(data) for data in self)
+
+    def __iter__(self):
+        """Yields the data from head to tail."""
+        slot = self._head
+        while slot != self._NONE:
+            yield self._data[slot]
+            slot = self._next[slot]
+
+    def __len__(self):
+        return self._size
+
+    def is_empty(self):
+        return self._size == 0
+
+    def get_size(self):
+        return self._size
+
+    def _grow(self):
+        """Adds a chunk of free slots to the columns."""
+        start = len(self._data)
+        self._data.extend([None] * self._CHUNK)
+        self._prev.extend(array("l", [self._NONE]) * self._CHUNK)
+        # Chain the new slots into the free list: start -> start + 1 -> ...
+        self._next.extend(range(start + 1, start + self._CHUNK + 1))
+        self._next[-1] = self._free
+        self._free = start
+        self._chunks += 1
+
+    def _allocate(self, data):
+        """Takes a slot from the free list, growing first if there is none."""
+        if self._free == self._NONE:
+            self._grow()
+        slot = self._free
+        self._free = self._next[slot]
+        self._data[slot] = data
+        return slot
+
+    def _release(self, slot):
+        """Returns a slot to the free list, dropping its data."""
+        self._data[slot] = None
+        self._prev[slot] = self._NONE
+        self._next[slot] = self._free
+        self._free = slot
+
+    def add_to_back(self, data):
+        slot = self._allocate(data)
+        self._prev[slot] = self._tail
+        self._next[slot] = self._NONE
+        if self.is_empty():
+            self._head = slot
+        else:
+            self._next[self._tail] = slot
+        self._tail = slot
+        self._size += 1
+
+    def add_to_front(self, data):
+        slot = self._allocate(data)
+        self._prev[slot] = self._NONE
+        self._next[slot] = self._head
+        if self.is_empty():
+            self._tail = slot
+        else:
+            self._prev[self._head] = slot
+        self._head = slot
+        self._size += 1
+
+    def find_middle(self):
+        """Returns the data of the middle node, or None if the list is empty.
+        If the list has an even number of nodes, the data of the second
+        middle node is returned."""
+        middle = None
+        if not self.is_empty():
+            # Move two cursors toward each other until they meet or cross
+            forward = self._head
+            backward = self._tail
+            while forward != backward and self._next[forward] != backward:
+                forward = self._next[forward]
+                backward = self._prev[backward]
+            middle = self._data[forward]
+        return middle
+
+    def has_loop(self):
+        """Returns True if following next from the head never reaches the
+        end of the list (Floyd's cycle-finding algorithm)."""
+        loop = False
+        slow = self._head
+        fast = self._head
+        while not loop and fast != self._NONE and self._next[fast] != self._NONE:
+            slow = self._next[slow]
+            fast = self._next[self._next[fast]]
+            loop = fast == slow
+        return loop
+
+    def has_gap_backward(self):
+        """Returns True if, walking from the head, some node's next does not
+        point back to it through prev."""
+        return self.has_gap_in_direction(forward=False)
+
+    def has_gap_forward(self):
+        """Returns True if, walking from the tail, some node's prev does not
+        point back to it through next."""
+        return self.has_gap_in_direction(forward=True)
+
+    def has_gap(self):
+        return self.has_gap_backward() or self.has_gap_forward()
+
+    def has_gap_in_direction(self, forward=True):
+        """Walks from the tail along prev (forward=True) or from the head
+        along next, checking that every link has its opposite link."""
+        if forward:
+            cursor, direction, opposite = self._tail, self._prev, self._next
+        else:
+            cursor, direction, opposite = self._head, self._next, self._prev
+        has_gap = False
+        while cursor != self._NONE and direction[cursor] != self._NONE and not has_gap:
+            following = direction[cursor]
+            has_gap = opposite[following] != cursor
+            cursor = following
+        return has_gap
+
+    def verify(self):
+        """Checks the whole list in one forward pass, as
+        DoublyLinkedList.verify() does. Returns None if the list is sound,
+        otherwise a tuple (position, problem) for the first bad node."""
+        problem = None
+        previous = self._NONE
+        cursor = self._head
+        position = 0
+        while cursor != self._NONE and problem is None:
+            if self._prev[cursor] != previous:
+                problem = (position, "prev does not point to the node before")
+            elif position == self._size:
+                problem = (position, "more nodes than get_size() reports")
+            else:
+                previous = cursor
+                cursor = self._next[cursor]
+                position += 1
+        if problem is None:
+            if position < self._size:
+                problem = (position, "list ends before get_size() nodes")
+            elif previous != self._tail:
+                problem = (max(position - 1, 0), "last node is not the tail")
+        return problem
+
+    def verify_sample(self, confidence=0.99, defect_rate=0.001):
+        """Like verify(), but checks only a random sample of the links, sized
+        as in DoublyLinkedList.verify_sample(). Returns None if no problem was
+        found."""
+        if not 0 < confidence < 1 or not 0 < defect_rate < 1:
+            raise ValueError("confidence and defect_rate must be between 0 and 1")
+        needed = math.ceil(math.log(1 - confidence) / math.log(1 - defect_rate))
+        sampled = sorted(random.sample(range(self._size),
+                                       min(needed, self._size)))
+        problem = None
+        cursor = self._head
+        position = 0
+        for target in sampled:
+            # Walk to the sampled node, only checking that the list goes on.
+            while problem is None and position < target:
+                if cursor == self._NONE:
+                    problem = (position, "list ends before get_size() nodes")
+                else:
+                    cursor = self._next[cursor]
+                    position += 1
+            if problem is None and cursor == self._NONE:
+                problem = (position, "list ends before get_size() nodes")
+            elif problem is None:
+                # Check the links on both sides of this node.
+                following = self._next[cursor]
+                if position == 0 and self._prev[cursor] != self._NONE:
+                    problem = (position, "prev does not point to the node before")
+                elif following != self._NONE and self._prev[following] != cursor:
+                    problem = (position + 1, "prev does not point to the node before")
+                elif following == self._NONE and cursor != self._tail:
+                    problem = (position, "last node is not the tail")
+        return problem
+
+    def _checked(self, index):
+        """Turns a negative index into a positive one, and raises IndexError
+        if the index is not in the list."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("list index out of range")
+        return index
+
+    def _slot_at(self, index):
+        """Returns the slot of the node at a valid index, walking from the
+        nearer end."""
+        if index < self._size // 2:
+            slot = self._head
+            for _ in range(index):
+                slot = self._next[slot]
+        else:
+            slot = self._tail
+            for _ in range(self._size - 1 - index):
+                slot = self._prev[slot]
+        return slot
+
+    def __getitem__(self, index):
+        return self._data[self._slot_at(self._checked(index))]
+
+    def __setitem__(self, index, data):
+        self._data[self._slot_at(self._checked(index))] = data
+
+    def insert(self, index, data):
+        """Inserts data before the given position. Like list.insert, negative
+        indices count from the end and indices past either end insert at
+        that end."""
+        if index < 0:
+            index = max(index + self._size, 0)
+        index = min(index, self._size)
+        if index == self._size:
+            self.add_to_back(data)
+        elif index == 0:
+            self.add_to_front(data)
+        else:
+            following = self._slot_at(index)
+            previous = self._prev[following]
+            slot = self._allocate(data)
+            self._prev[slot] = previous
+            self._next[slot] = following
+            self._next[previous] = slot
+            self._prev[following] = slot
+            self._size += 1
+
+    def pop(self, index=-1):
+        """Removes and returns the data at the given position, the last one
+        by default, walking from the nearer end. pop() and pop(0) are O(1).
+        Raises IndexError if the position is not in the list."""
+        slot = self._slot_at(self._checked(index))
+        previous = self._prev[slot]
+        following = self._next[slot]
+        if previous == self._NONE:
+            self._head = following
+        else:
+            self._next[previous] = following
+        if following == self._NONE:
+            self._tail = previous
+        else:
+            self._prev[following] = previous
+        data = self._data[slot]
+        self._release(slot)
+        self._size -= 1
+        return data
+
+    def allocation_count(self):
+        """Returns how many times the columns had to grow."""
+        return self._chunks
+
+
+# --- Churn benchmark against the Node-based list ---
+if __name__ == "__main__":
+    import gc
+    import time
+    import tracemalloc
+    from SOLUTIONS_DoublyLinkedList import DoublyLinkedList
+
+    SIZE = 200_000
+    ROUNDS = 5
+
+    def collections():
+        """Total number of garbage collection runs so far."""
+        return sum(generation["collections"] for generation in gc.get_stats())
+
+    for list_class in (DoublyLinkedList, PooledDoublyLinkedList):
+        tracemalloc.start()
+        dll = list_class()
+        for i in range(SIZE):
+            dll.add_to_back(i)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        runs = collections()
+        start = time.perf_counter()
+        # Churn: drain from the front while refilling at the back.
+        for _ in range(ROUNDS):
+            for i in range(SIZE):
+                dll.pop(0)
+                dll.add_to_back(i)
+        elapsed = time.perf_counter() - start
+        if list_class is PooledDoublyLinkedList:
+            allocations = f"{dll.allocation_count()} chunk allocations"
+        else:
+            allocations = f"{SIZE * (ROUNDS + 1)} Node allocations"
+        print(f"{list_class.__name__:>22}: {memory / SIZE:5.1f} bytes/element, "
+              f"{allocations}, churn {elapsed:.2f}s, "
+              f"{collections() - runs} GC runs during churn")
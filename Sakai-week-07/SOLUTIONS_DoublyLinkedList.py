@@ -1,3 +1,5 @@
+import math
+import random
 from Node import Node
 
 
@@ -7,6 +9,14 @@ class DoublyLinkedList:
         self.__head = None
         self.__tail = None
         self.__size = 0
+        # Last node reached by position, and its index, for positional access
+        self.__finger = None
+        self.__finger_index = 0
+        # Hit counts for the COUNT search policy, and search instrumentation
+        self.__hit_counts = {}
+        self.__searches = 0
+        self.__hits = 0
+        self.__search_depth = 0
 
     def __str__(self):
         return self.__repr__()
@@ -44,6 +54,8 @@ class DoublyLinkedList:
             self.__head.set_prev(new_node)
         self.__head = new_node
         self.__size += 1
+        # Every node, including the finger, moved one position back.
+        self.__finger_index += 1
 
     def find_middle(self):
         """Returns the middle node of the list. If the list has an even number of nodes,
@@ -129,3 +141,406 @@ class DoublyLinkedList:
                 has_gap = opposite(next) != cursor
                 cursor = next
         return has_gap
+
+    # A single-pass audit for very long lists. Also "Leo stuff", beyond the
+    # assignment.
+    def verify(self):
+        """Checks the whole list in one forward pass with O(1) extra memory:
+        every node's prev must point back to the node before it, the walk
+        must end at the tail after exactly get_size() nodes. Returns None if
+        the list is sound, otherwise a tuple (position, problem) for the
+        first bad node found.
+
+        No separate loop check is needed. The first node the walk would
+        visit twice is reached again from a different node than its prev
+        (for the head, prev must be None), so the symmetry check catches it
+        before the walk can go around."""
+        problem = None
+        previous = None
+        cursor = self.__head
+        position = 0
+        while cursor is not None and problem is None:
+            if cursor.prev is not previous:
+                problem = (position, "prev does not point to the node before")
+            elif position == self.__size:
+                problem = (position, "more nodes than get_size() reports")
+            else:
+                previous = cursor
+                cursor = cursor.next
+                position += 1
+        if problem is None:
+            if position < self.__size:
+                problem = (position, "list ends before get_size() nodes")
+            elif previous is not self.__tail:
+                problem = (max(position - 1, 0), "last node is not the tail")
+        return problem
+
+    def verify_sample(self, confidence=0.99, defect_rate=0.001):
+        """Like verify(), but checks only a random sample of the prev/next
+        links. The sample is big enough that, if at least defect_rate of the
+        links were broken, a broken one would be sampled with the given
+        confidence. The walk to the sampled nodes is still needed, but the
+        checks are skipped elsewhere, and the walk stops at the last sampled
+        node. Returns None if no problem was found."""
+        if not 0 < confidence < 1 or not 0 < defect_rate < 1:
+            raise ValueError("confidence and defect_rate must be between 0 and 1")
+        needed = math.ceil(math.log(1 - confidence) / math.log(1 - defect_rate))
+        sampled = sorted(random.sample(range(self.__size),
+                                       min(needed, self.__size)))
+        problem = None
+        cursor = self.__head
+        position = 0
+        for target in sampled:
+            # Walk to the sampled node, only checking that the list goes on.
+            while problem is None and position < target:
+                if cursor is None:
+                    problem = (position, "list ends before get_size() nodes")
+                else:
+                    cursor = cursor.next
+                    position += 1
+            if problem is None and cursor is None:
+                problem = (position, "list ends before get_size() nodes")
+            elif problem is None:
+                # Check the links on both sides of this node.
+                if position == 0 and cursor.prev is not None:
+                    problem = (position, "prev does not point to the node before")
+                elif cursor.next is not None and cursor.next.prev is not cursor:
+                    problem = (position + 1, "prev does not point to the node before")
+                elif cursor.next is None and cursor is not self.__tail:
+                    problem = (position, "last node is not the tail")
+        return problem
+
+    # Positional access, like a Python list. Walks start from the head, the
+    # tail or the finger (the node of the last positional access), whichever
+    # is closest, so sequential or nearby accesses cost O(1) amortized.
+    def __checked(self, index):
+        """Turns a negative index into a positive one, and raises IndexError
+        if the index is not in the list."""
+        if index < 0:
+            index += self.__size
+        if not 0 <= index < self.__size:
+            raise IndexError("list index out of range")
+        return index
+
+    def __node_at(self, index):
+        """Returns the node at a valid index and moves the finger to it."""
+        # Start from the head or the tail, whichever is closer ...
+        cursor = self.__head
+        position = 0
+        if self.__size - 1 - index < index:
+            cursor = self.__tail
+            position = self.__size - 1
+        # ... unless the finger is even closer.
+        if (self.__finger is not None
+                and abs(self.__finger_index - index) < abs(position - index)):
+            cursor = self.__finger
+            position = self.__finger_index
+        while position < index:
+            cursor = cursor.get_next()
+            position += 1
+        while position > index:
+            cursor = cursor.get_prev()
+            position -= 1
+        self.__finger = cursor
+        self.__finger_index = index
+        return cursor
+
+    def __getitem__(self, index):
+        return self.__node_at(self.__checked(index)).get_data()
+
+    def __setitem__(self, index, data):
+        self.__node_at(self.__checked(index)).set_data(data)
+
+    def insert(self, index, data):
+        """Inserts data before the given position. Like list.insert, negative
+        indices count from the end and indices past either end insert at
+        that end."""
+        if index < 0:
+            index = max(index + self.__size, 0)
+        index = min(index, self.__size)
+        if index == self.__size:
+            self.add_to_back(data)
+            new_node = self.__tail
+        elif index == 0:
+            self.add_to_front(data)
+            new_node = self.__head
+        else:
+            following = self.__node_at(index)
+            new_node = Node(data)
+            new_node.set_prev(following.get_prev())
+            new_node.set_next(following)
+            following.get_prev().set_next(new_node)
+            following.set_prev(new_node)
+            self.__size += 1
+        self.__finger = new_node
+        self.__finger_index = index
+
+    def pop(self, index=-1):
+        """Removes and returns the data at the given position, the last one
+        by default. Raises IndexError if the position is not in the list."""
+        index = self.__checked(index)
+        node = self.__node_at(index)
+        previous = node.get_prev()
+        following = node.get_next()
+        if previous is None:
+            self.__head = following
+        else:
+            previous.set_next(following)
+        if following is None:
+            self.__tail = previous
+        else:
+            following.set_prev(previous)
+        self.__size -= 1
+        # Keep the finger on a node that is still in the list.
+        if following is not None:
+            self.__finger = following
+        elif previous is not None:
+            self.__finger = previous
+            self.__finger_index = index - 1
+        else:
+            self.__finger = None
+            self.__finger_index = 0
+        self.__hit_counts.pop(node, None)
+        node.set_next(None)
+        node.set_prev(None)
+        return node.get_data()
+
+    # Self-organizing search. After a hit, a policy can move the node found
+    # toward the head, so that values searched often become cheap to find.
+    MOVE_TO_FRONT = "move-to-front"
+    TRANSPOSE = "transpose"
+    COUNT = "count"
+
+    def find(self, value, policy=None):
+        """Returns the first node whose data equals value, or None. With a
+        policy, the node found is then moved toward the head:
+          - MOVE_TO_FRONT moves it to the head,
+          - TRANSPOSE swaps it with the node before it,
+          - COUNT counts the hits of every node and moves it in front of the
+            nodes with fewer hits, so the list stays ordered by hit count.
+        Every search is recorded for search_stats()."""
+        if policy not in (None, self.MOVE_TO_FRONT, self.TRANSPOSE, self.COUNT):
+            raise ValueError(f"unknown search policy {policy!r}")
+        node = self.__head
+        depth = 1
+        while node is not None and node.get_data() != value:
+            node = node.get_next()
+            depth += 1
+        self.__searches += 1
+        if node is None:
+            # A miss looks at every node.
+            self.__search_depth += self.__size
+        else:
+            self.__search_depth += depth
+            self.__hits += 1
+            target = None
+            if policy == self.MOVE_TO_FRONT:
+                target = self.__head
+            elif policy == self.TRANSPOSE:
+                target = node.get_prev()
+            elif policy == self.COUNT:
+                count = self.__hit_counts.get(node, 0) + 1
+                self.__hit_counts[node] = count
+                target = node
+                while (target.get_prev() is not None
+                       and self.__hit_counts.get(target.get_prev(), 0) < count):
+                    target = target.get_prev()
+            if target is not None and target is not node:
+                self.__move_before(node, target)
+        return node
+
+    def __move_before(self, node, following):
+        """Relinks a node right before another node that comes earlier in
+        the list, keeping the head and the tail up to date."""
+        # Unlink the node; it is not the head since following is before it.
+        previous = node.get_prev()
+        after = node.get_next()
+        previous.set_next(after)
+        if after is None:
+            self.__tail = previous
+        else:
+            after.set_prev(previous)
+        # Link it back in before following.
+        node.set_prev(following.get_prev())
+        node.set_next(following)
+        if following.get_prev() is None:
+            self.__head = node
+        else:
+            following.get_prev().set_next(node)
+        following.set_prev(node)
+        # Positions changed, so the finger is no longer valid.
+        self.__finger = None
+        self.__finger_index = 0
+
+    def search_stats(self):
+        """Returns the number of searches and hits made by find(), and the
+        average number of nodes a search looked at."""
+        average = self.__search_depth / self.__searches if self.__searches else 0.0
+        return {
+            "searches": self.__searches,
+            "hits": self.__hits,
+            "average_depth": average,
+        }
+
+    def reset_search_stats(self):
+        """Clears the counters of search_stats(); hit counts are kept."""
+        self.__searches = 0
+        self.__hits = 0
+        self.__search_depth = 0
+
+    # Sorting in place by relinking the nodes, without copying the data out.
+    def sort(self, key=None, reverse=False):
+        """Sorts the list by data (or by key(data)), stably, like list.sort.
+        Bottom-up natural merge sort: every pass splits the list into its
+        already-sorted runs and merges them two by two, until one run is
+        left. The merges follow next pointers only, and a final pass rebuilds
+        the prev pointers and the tail. O(n log n) time, and O(1) extra
+        memory because there is no recursion and no copy of the data."""
+        # comes_before(first, second) is True if second must come strictly
+        # before first. Picking the variant up front keeps the comparisons,
+        # the hot spot of the sort, as cheap as possible.
+        if key is None and not reverse:
+            comes_before = _data_less
+        elif key is None:
+            comes_before = _data_greater
+        elif not reverse:
+            def comes_before(first, second):
+                return key(second.data) < key(first.data)
+        else:
+            def comes_before(first, second):
+                return key(second.data) > key(first.data)
+
+        runs = 2
+        while runs > 1:
+            runs = 0
+            merged_head = None
+            merged_tail = None
+            cursor = self.__head
+            while cursor is not None:
+                # Cut off the next two sorted runs ...
+                left = cursor
+                cursor = _cut_run(left, comes_before)
+                right = cursor
+                if right is not None:
+                    cursor = _cut_run(right, comes_before)
+                # ... merge them, and append the result to this pass's list.
+                head, tail = _merge_runs(left, right, comes_before)
+                if merged_head is None:
+                    merged_head = head
+                else:
+                    merged_tail.next = head
+                merged_tail = tail
+                runs += 1
+            self.__head = merged_head
+        # Restore the prev pointers and the tail in one last walk.
+        previous = None
+        cursor = self.__head
+        while cursor is not None:
+            cursor.prev = previous
+            previous = cursor
+            cursor = cursor.next
+        self.__tail = previous
+        # Positions changed, so the finger is no longer valid.
+        self.__finger = None
+        self.__finger_index = 0
+
+
+def _data_less(first, second):
+    return second.data < first.data
+
+
+def _data_greater(first, second):
+    return second.data > first.data
+
+
+def _cut_run(start, comes_before):
+    """Finds the sorted run starting at node start, detaches it from the rest
+    of the chain, and returns the first node after it (or None)."""
+    end = start
+    while end.next is not None and not comes_before(end, end.next):
+        end = end.next
+    rest = end.next
+    end.next = None
+    return rest
+
+
+def _merge_runs(left, right, comes_before):
+    """Merges two detached sorted runs along their next pointers and returns
+    the head and tail of the result. On ties the left node goes first, which
+    keeps the sort stable."""
+    head = None
+    tail = None
+    while left is not None and right is not None:
+        if comes_before(left, right):
+            taken = right
+            right = right.next
+        else:
+            taken = left
+            left = left.next
+        if head is None:
+            head = taken
+        else:
+            tail.next = taken
+        tail = taken
+    # One run is used up; the other one is attached as it is.
+    rest = left if left is not None else right
+    if head is None:
+        head = rest
+    else:
+        tail.next = rest
+    while tail is None or tail.next is not None:
+        tail = rest if tail is None else tail.next
+    return head, tail
+
+
+# --- Benchmark: in-place sort against copying to a list and rebuilding ---
+if __name__ == "__main__":
+    import time
+
+    SIZE = 200_000
+
+    def build(values):
+        dll = DoublyLinkedList()
+        for value in values:
+            dll.add_to_back(value)
+        return dll
+
+    def list_and_rebuild(dll):
+        values = [dll.pop(0) for _ in range(dll.get_size())]
+        values.sort()
+        return build(values)
+
+    random.seed(271)
+    shuffled = [random.random() for _ in range(SIZE)]
+    nearly_sorted = sorted(shuffled)
+    for i in range(0, SIZE, 100):
+        nearly_sorted[i] = random.random()
+    for name, values in (("random", shuffled), ("nearly sorted", nearly_sorted)):
+        dll = build(values)
+        start = time.perf_counter()
+        dll.sort()
+        in_place = time.perf_counter() - start
+        dll = build(values)
+        start = time.perf_counter()
+        list_and_rebuild(dll)
+        rebuilt = time.perf_counter() - start
+        print(f"{name:>13}: in-place merge sort {in_place:.3f}s, "
+              f"list and rebuild {rebuilt:.3f}s")
+
+    # Average search depth of every policy under a Zipf-like workload
+    KEYS = 1_000
+    SEARCHES = 50_000
+    weights = [1 / rank for rank in range(1, KEYS + 1)]
+    keys = list(range(KEYS))
+    random.shuffle(keys)
+    workload = random.choices(keys, weights, k=SEARCHES)
+    policies = (None, DoublyLinkedList.MOVE_TO_FRONT,
+                DoublyLinkedList.TRANSPOSE, DoublyLinkedList.COUNT)
+    for policy in policies:
+        dll = build(range(KEYS))
+        start = time.perf_counter()
+        for value in workload:
+            dll.find(value, policy)
+        elapsed = time.perf_counter() - start
+        depth = dll.search_stats()["average_depth"]
+        print(f"{str(policy):>13}: average depth {depth:6.1f}, {elapsed:.3f}s")
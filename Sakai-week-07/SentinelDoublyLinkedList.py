@@ -0,0 +1,126 @@
+from Node import Node
+
+
+class SentinelDoublyLinkedList:
+    """A circular doubly linked list built around a sentinel node. The
+    sentinel sits between the last and the first node: its next is the head
+    and its prev is the tail, and in an empty list both point back to the
+    sentinel itself. Every node therefore has real neighbors, so adding,
+    removing and moving nodes never has to check whether the list is empty
+    or whether a node is at an end.
+
+    Because the node before the head is the sentinel, not None, the Node
+    predicates is_first() and is_last() do not apply to nodes of this list.
+
+    The methods that take a node assume it belongs to this list; that is
+    not checked, which is what makes them O(1)."""
+
+    def __init__(self):
+        self._sentinel = Node(None)
+        self._sentinel.next = self._sentinel
+        self._sentinel.prev = self._sentinel
+        self._size = 0
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __repr__(self):
+        return " <-> ".join(str(data) for data in self)
+
+    def __iter__(self):
+        """Yields the data from head to tail."""
+        current = self._sentinel.next
+        while current is not self._sentinel:
+            yield current.data
+            current = current.next
+
+    def __len__(self):
+        return self._size
+
+    def is_empty(self):
+        return self._size == 0
+
+    def get_size(self):
+        return self._size
+
+    def get_head(self):
+        """Returns the first node, or None if the list is empty."""
+        head = self._sentinel.next
+        return None if head is self._sentinel else head
+
+    def get_tail(self):
+        """Returns the last node, or None if the list is empty."""
+        tail = self._sentinel.prev
+        return None if tail is self._sentinel else tail
+
+    def _link_after(self, anchor, node):
+        """Places node right after anchor. No emptiness check is needed: in
+        an empty list the anchor is the sentinel and its next is itself."""
+        node.prev = anchor
+        node.next = anchor.next
+        anchor.next.prev = node
+        anchor.next = node
+
+    def _unlink(self, node):
+        """Takes node out of the chain without touching the size."""
+        node.prev.next = node.next
+        node.next.prev = node.prev
+
+    def add_to_back(self, data):
+        """Adds data at the end and returns its node."""
+        return self.insert_after(self._sentinel.prev, data)
+
+    def add_to_front(self, data):
+        """Adds data at the beginning and returns its node."""
+        return self.insert_after(self._sentinel, data)
+
+    def insert_after(self, node, data):
+        """Adds data right after the given node and returns the new node."""
+        new_node = Node(data)
+        self._link_after(node, new_node)
+        self._size += 1
+        return new_node
+
+    def remove(self, node):
+        """Removes the given node from the list and returns its data."""
+        self._unlink(node)
+        node.next = None
+        node.prev = None
+        self._size -= 1
+        return node.data
+
+    def move_to_front(self, node):
+        """Moves a node of this list to the front. The node is relinked, not
+        copied, so nothing is allocated."""
+        self._unlink(node)
+        self._link_after(self._sentinel, node)
+
+    def move_to_back(self, node):
+        """Moves a node of this list to the back, without allocating."""
+        self._unlink(node)
+        self._link_after(self._sentinel.prev, node)
+
+    def transfer_to_front(self, node, other):
+        """Moves a node of this list to the front of the other list, without
+        allocating."""
+        self._unlink(node)
+        self._size -= 1
+        other._link_after(other._sentinel, node)
+        other._size += 1
+
+    def splice(self, other):
+        """Moves all the nodes of other to the end of this list in O(1), by
+        relinking the two ends of other's chain. other is left empty."""
+        if other is not self and not other.is_empty():
+            first = other._sentinel.next
+            last = other._sentinel.prev
+            # Hook other's chain between this list's tail and its sentinel.
+            first.prev = self._sentinel.prev
+            self._sentinel.prev.next = first
+            last.next = self._sentinel
+            self._sentinel.prev = last
+            self._size += other._size
+            # other goes back to being an empty circle.
+            other._sentinel.next = other._sentinel
+            other._sentinel.prev = other._sentinel
+            other._size = 0
@@ -0,0 +1,297 @@
+from SentinelDoublyLinkedList import SentinelDoublyLinkedList
+
+
+class _GapChunk:
+    """A fixed-capacity gap buffer: the characters are kept in a list with a
+    hole (the gap) at the last edit position. Typing fills the gap from the
+    left and deleting widens it, so edits at the same place cost O(1); the
+    gap only moves, by a slice copy, when the edit position changes. The
+    chunk also counts its newlines."""
+
+    __slots__ = ("_chars", "_gap_start", "_gap_end", "_newlines")
+
+    def __init__(self, capacity, text=""):
+        self._chars = list(text) + [None] * (capacity - len(text))
+        self._gap_start = len(text)
+        self._gap_end = capacity
+        self._newlines = text.count("\n")
+
+    def __len__(self):
+        return len(self._chars) - (self._gap_end - self._gap_start)
+
+    def room(self):
+        return self._gap_end - self._gap_start
+
+    def newline_count(self):
+        return self._newlines
+
+    def text(self):
+        return "".join(self._chars[:self._gap_start]) + "".join(
+            self._chars[self._gap_end:])
+
+    def _move_gap(self, offset):
+        """Moves the gap so that it starts at the given offset."""
+        if offset < self._gap_start:
+            # Characters between offset and the gap go to the right of it.
+            moved = self._gap_start - offset
+            self._chars[self._gap_end - moved:self._gap_end] = \
+                self._chars[offset:self._gap_start]
+            self._gap_start = offset
+            self._gap_end -= moved
+        elif offset > self._gap_start:
+            # Characters right after the gap go to the left of it.
+            moved = offset - self._gap_start
+            self._chars[self._gap_start:offset] = \
+                self._chars[self._gap_end:self._gap_end + moved]
+            self._gap_start = offset
+            self._gap_end += moved
+
+    def insert(self, offset, text):
+        """Inserts text, which must fit in the gap, at the given offset.
+        Returns the number of newlines inserted."""
+        self._move_gap(offset)
+        self._chars[self._gap_start:self._gap_start + len(text)] = text
+        self._gap_start += len(text)
+        newlines = text.count("\n")
+        self._newlines += newlines
+        return newlines
+
+    def delete(self, offset, count):
+        """Deletes count characters starting at the given offset. Returns the
+        number of newlines deleted."""
+        self._move_gap(offset)
+        newlines = self._chars[self._gap_end:self._gap_end + count].count("\n")
+        self._gap_end += count
+        self._newlines -= newlines
+        return newlines
+
+    def offset_after_newline(self, nth):
+        """Returns the offset just after the nth newline of the chunk."""
+        text = self.text()
+        offset = -1
+        for _ in range(nth):
+            offset = text.index("\n", offset + 1)
+        return offset + 1
+
+
+class TextBuffer:
+    """An editable text made of chunks of up to chunk_size characters, each
+    a gap buffer, held in a doubly linked list. Editing at the cursor works
+    inside one chunk, so typing or deleting there is O(1) amortized. A full
+    chunk is split in two halves. A chunk that drops below a quarter full
+    is merged with a neighbor when the two fill at most three quarters of
+    a chunk, so merges and splits cannot chase each other. Each chunk counts
+    its newlines, so finding a line skips whole chunks.
+
+    The buffer always has at least one chunk, possibly empty."""
+
+    _DEFAULT_CHUNK_SIZE = 4096
+
+    def __init__(self, text="", chunk_size=_DEFAULT_CHUNK_SIZE):
+        if chunk_size < 4:
+            raise ValueError("chunk_size must be at least 4")
+        self._capacity = chunk_size
+        self._chunks = SentinelDoublyLinkedList()
+        self._chunks.add_to_back(_GapChunk(chunk_size))
+        self._length = 0
+        self._newlines = 0
+        # The cursor: its chunk's node, its offset there, and its position
+        self._node = self._chunks.get_head()
+        self._offset = 0
+        self._position = 0
+        self.insert(text)
+        self.move_to(0)
+
+    def __len__(self):
+        return self._length
+
+    def __str__(self):
+        return "".join(chunk.text() for chunk in self._chunks)
+
+    def cursor(self):
+        """Returns the position of the cursor."""
+        return self._position
+
+    def line_count(self):
+        return self._newlines + 1
+
+    def _next_chunk(self, node):
+        return None if node is self._chunks.get_tail() else node.get_next()
+
+    def _previous_chunk(self, node):
+        return None if node is self._chunks.get_head() else node.get_prev()
+
+    def move_to(self, position):
+        """Moves the cursor to the given position, clamped to the text. The
+        walk starts from the cursor's chunk and skips whole chunks."""
+        position = max(0, min(position, self._length))
+        node = self._node
+        start = self._position - self._offset
+        while position < start:
+            node = self._previous_chunk(node)
+            start -= len(node.get_data())
+        while position > start + len(node.get_data()):
+            start += len(node.get_data())
+            node = self._next_chunk(node)
+        self._node = node
+        self._offset = position - start
+        self._position = position
+
+    def insert(self, text):
+        """Inserts text at the cursor and moves the cursor past it."""
+        index = 0
+        while index < len(text):
+            if self._node.get_data().room() == 0:
+                self._split()
+            chunk = self._node.get_data()
+            piece = text[index:index + chunk.room()]
+            self._newlines += chunk.insert(self._offset, piece)
+            self._offset += len(piece)
+            self._position += len(piece)
+            self._length += len(piece)
+            index += len(piece)
+
+    def _split(self):
+        """Splits the cursor's full chunk into two halves, keeping the cursor
+        on the half that holds its position."""
+        node = self._node
+        text = node.get_data().text()
+        half = len(text) // 2
+        node.set_data(_GapChunk(self._capacity, text[:half]))
+        right = self._chunks.insert_after(node, _GapChunk(self._capacity, text[half:]))
+        if self._offset > half:
+            self._node = right
+            self._offset -= half
+
+    def delete(self, count=1):
+        """Deletes up to count characters after the cursor and returns how
+        many were deleted. The cursor does not move."""
+        deleted = 0
+        while deleted < count and self._position < self._length:
+            chunk = self._node.get_data()
+            if self._offset == len(chunk):
+                # Nothing left in this chunk: continue at the next one.
+                self._node = self._next_chunk(self._node)
+                self._offset = 0
+            else:
+                removed = min(count - deleted, len(chunk) - self._offset)
+                self._newlines -= chunk.delete(self._offset, removed)
+                self._length -= removed
+                deleted += removed
+                self._rebalance()
+        return deleted
+
+    def backspace(self, count=1):
+        """Deletes up to count characters before the cursor, which moves back
+        over them. Returns how many were deleted."""
+        end = self._position
+        self.move_to(end - count)
+        return self.delete(end - self._position)
+
+    def _rebalance(self):
+        """Drops the cursor's chunk if it is empty, or merges it with a
+        neighbor if it is less than a quarter full and the two fit in three
+        quarters of a chunk."""
+        node = self._node
+        chunk = node.get_data()
+        following = self._next_chunk(node)
+        previous = self._previous_chunk(node)
+        limit = 3 * self._capacity // 4
+        if len(chunk) == 0 and (following is not None or previous is not None):
+            self._chunks.remove(node)
+            if following is not None:
+                self._node = following
+                self._offset = 0
+            else:
+                self._node = previous
+                self._offset = len(previous.get_data())
+        elif len(chunk) < self._capacity // 4:
+            if following is not None and len(chunk) + len(following.get_data()) <= limit:
+                node.set_data(_GapChunk(self._capacity,
+                                        chunk.text() + following.get_data().text()))
+                self._chunks.remove(following)
+            elif previous is not None and len(previous.get_data()) + len(chunk) <= limit:
+                before = previous.get_data()
+                previous.set_data(_GapChunk(self._capacity, before.text() + chunk.text()))
+                self._chunks.remove(node)
+                self._node = previous
+                self._offset += len(before)
+
+    def line_start(self, line):
+        """Returns the position where the given line (0-based) starts. Chunks
+        with fewer newlines than still needed are skipped whole."""
+        if not 0 <= line <= self._newlines:
+            raise IndexError("line out of range")
+        position = 0
+        remaining = line
+        node = self._chunks.get_head()
+        while remaining > 0:
+            chunk = node.get_data()
+            if chunk.newline_count() < remaining:
+                remaining -= chunk.newline_count()
+                position += len(chunk)
+                node = self._next_chunk(node)
+            else:
+                position += chunk.offset_after_newline(remaining)
+                remaining = 0
+        return position
+
+
+# --- Benchmark: replaying an edit trace against one character per Node ---
+if __name__ == "__main__":
+    import random
+    import time
+    import tracemalloc
+    from SOLUTIONS_DoublyLinkedList import DoublyLinkedList
+
+    SIZE = 200_000
+    EDITS = 20_000
+    random.seed(271)
+    document = "".join(random.choice("abcdefghij klmnop\n") for _ in range(SIZE))
+    # The trace: mostly typing and deleting near the last edit, sometimes a
+    # jump to another place in the document.
+    trace = []
+    position = 0
+    for _ in range(EDITS):
+        if random.random() < 0.02:
+            position = random.randrange(SIZE)
+        else:
+            position = max(0, position + random.randint(-20, 20))
+        if random.random() < 0.7:
+            trace.append(("insert", position, random.choice("qrstuvwxyz\n")))
+        else:
+            trace.append(("delete", position, None))
+
+    tracemalloc.start()
+    buffer = TextBuffer(document)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for action, position, character in trace:
+        buffer.move_to(position)
+        if action == "insert":
+            buffer.insert(character)
+        else:
+            buffer.delete()
+    elapsed = time.perf_counter() - start
+    print(f"{'TextBuffer':>20}: {memory / SIZE:6.1f} bytes/char, "
+          f"trace {elapsed:.3f}s")
+
+    tracemalloc.start()
+    characters = DoublyLinkedList()
+    for character in document:
+        characters.add_to_back(character)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for action, position, character in trace:
+        position = min(position, characters.get_size())
+        if action == "insert":
+            characters.insert(position, character)
+        elif position < characters.get_size():
+            characters.pop(position)
+    elapsed = time.perf_counter() - start
+    print(f"{'one char per Node':>20}: {memory / SIZE:6.1f} bytes/char, "
+          f"trace {elapsed:.3f}s")
+    same = str(buffer) == "".join(characters[i] for i in range(characters.get_size()))
+    print("Same final text:", same)
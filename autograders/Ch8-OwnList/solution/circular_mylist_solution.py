@@ -0,0 +1,154 @@
+from mylist_solution import MyList
+
+
+class CircularMyList(MyList):
+    """A MyList that treats its block as a ring. The first element sits at
+    position _head of _data, not necessarily at 0, and the elements wrap
+    around from the end of the block to its start. Adding or removing at
+    either end moves no elements, so insert(0, x), remove(0), append and pop
+    are all O(1). In the middle, the elements on the side of the nearer end
+    are shifted, which moves at most half of them, with slice assignments
+    over the contiguous parts of the ring.
+
+    Resizing copies the elements to the start of the new block, in order, so
+    the head is back at 0 after every resize. __str__, __len__ and the resize
+    policy are those of MyList."""
+
+    def __init__(self, maximum_size: int = MyList._DEFAULT_SIZE,
+                 growth_factor: float = MyList._RESIZE_BY,
+                 shrink_threshold: float = MyList._SHRINK_AT):
+        """Create an empty ring with the head at position 0."""
+        super().__init__(maximum_size, growth_factor, shrink_threshold)
+        # Position in _data of the first element
+        self._head: int = 0
+
+    def _slot(self, index: int) -> int:
+        """Return the position in _data of the element at the given index."""
+        return (self._head + index) % self._maximum_size
+
+    def _read(self, index: int, count: int) -> list:
+        """Return a copy of count elements from the given index on, with one
+        slice, or two if they wrap around the end of the block."""
+        start = self._slot(index)
+        end = start + count
+        if end <= self._maximum_size:
+            values = self._data[start:end]
+        else:
+            values = self._data[start:] + self._data[:end - self._maximum_size]
+        return values
+
+    def _write(self, index: int, values: list) -> None:
+        """Overwrite the elements from the given index on with values, with one
+        slice assignment, or two if they wrap around the end of the block."""
+        start = self._slot(index)
+        fits = min(len(values), self._maximum_size - start)
+        self._data[start:start + fits] = values[:fits]
+        self._data[:len(values) - fits] = values[fits:]
+
+    def _values(self) -> list:
+        """Return a copy of the actual elements, in order, joining the two
+        parts of the ring if it wraps around."""
+        return self._read(0, self._actual_size)
+
+    def _resize(self, new_size: int) -> None:
+        """Move the elements to the start of a new block."""
+        super()._resize(new_size)
+        self._head = 0
+
+    def _unroll(self) -> None:
+        """Rotate the elements in place so that the head is at position 0, as
+        the batch operations of MyList expect."""
+        if self._head != 0:
+            values = self._values()
+            self._data[:self._actual_size] = values
+            self._data[self._actual_size:] = \
+                self._new_block(self._maximum_size - self._actual_size)
+            self._head = 0
+
+    def insert(self, index: int, value) -> None:
+        """Insert value at the given index, shifting the elements toward the
+        nearer end. If the index is invalid, do nothing."""
+        # Validate the index and proceed only if it's valid
+        if 0 <= index <= self._actual_size:
+            # Ensure there is enough capacity to add a new element
+            self._ensure_capacity()
+            if index < self._actual_size // 2:
+                # Nearer the front: move the head back one slot and shift the
+                # elements before index left into it.
+                self._head = (self._head - 1) % self._maximum_size
+                self._write(0, self._read(1, index))
+            else:
+                # Nearer the back: shift the elements from index on right.
+                self._write(index + 1, self._read(index, self._actual_size - index))
+            # insert the new value
+            self._data[self._slot(index)] = value
+            # Increment the actual size to reflect the addition
+            self._actual_size += 1
+
+    def remove(self, index: int):
+        """Remove and return the element at the given index, shifting the
+        elements from the nearer end. If the index is invalid, return None."""
+        # Initialize the variable to hold the removed value
+        removed = None
+        # Validate the index and proceed only if it's valid
+        if 0 <= index < self._actual_size:
+            # Retrieve the value to be removed
+            removed = self._data[self._slot(index)]
+            if index < self._actual_size // 2:
+                # Nearer the front: shift the elements before index right,
+                # then clear the old head and move the head forward.
+                self._write(1, self._read(0, index))
+                self._data[self._head] = self._VACANT
+                self._head = (self._head + 1) % self._maximum_size
+            else:
+                # Nearer the back: shift the elements after index left, then
+                # clear the last position which is now a duplicate.
+                self._write(index, self._read(index + 1, self._actual_size - 1 - index))
+                self._data[self._slot(self._actual_size - 1)] = self._VACANT
+            # Decrement the actual size to reflect the removal
+            self._actual_size -= 1
+            # Give memory back if the list has drained enough
+            self._release_capacity()
+        return removed
+
+    def insert_many(self, index: int, values) -> None:
+        """Insert all the given values at the given index, in order, after
+        rotating the head to position 0."""
+        self._unroll()
+        super().insert_many(index, values)
+
+    def remove_range(self, start: int, stop: int):
+        """Remove and return the elements from start up to stop, after
+        rotating the head to position 0."""
+        self._unroll()
+        return super().remove_range(start, stop)
+
+
+# --- Benchmark: queue use, insert(0, x) and remove(0), against MyList ---
+if __name__ == "__main__":
+    import time
+
+    ROUNDS = 2_000
+    for size in (1_000, 10_000, 100_000):
+        for list_class in (MyList, CircularMyList):
+            queue = list_class()
+            queue.extend(range(size))
+            start = time.perf_counter()
+            for i in range(ROUNDS):
+                queue.insert(0, i)
+                queue.pop()
+            for i in range(ROUNDS):
+                queue.append(i)
+                queue.remove(0)
+            elapsed = time.perf_counter() - start
+            print(f"{list_class.__name__:>14} with {size:>7} elements: "
+                  f"{2 * ROUNDS / elapsed:12,.0f} front operations/s")
+
+    ring = CircularMyList(4)
+    ring.append("B")
+    ring.append("C")
+    ring.insert(0, "A")
+    ring.insert(3, "D")
+    print(ring, ring._head)                     # 4/4; [ A, B, C, D ] 3
+    ring.insert(2, "X")
+    print(ring, ring._head)                     # 5/8; [ A, B, X, C, D ] 0
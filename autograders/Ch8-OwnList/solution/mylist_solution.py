@@ -9,18 +9,43 @@ class MyList:
     # --- Default values ---
     _RESIZE_BY = 2
     _DEFAULT_SIZE = 4
+    # A shrink threshold of 0 means the list never shrinks
+    _SHRINK_AT = 0
+    # What an unused slot of the block holds
+    _VACANT = None
 
-    def __init__(self, maximum_size: int = _DEFAULT_SIZE):
+    def __init__(self, maximum_size: int = _DEFAULT_SIZE,
+                 growth_factor: float = _RESIZE_BY,
+                 shrink_threshold: float = _SHRINK_AT):
         """Create an empty list with a fixed size block specified by parameter
         maximum_size. The object tracks how many actual elements are in the
         list using the attribute __actual_size.
+
+        When the list is full, its block grows by growth_factor. When removing
+        leaves it at most shrink_threshold full, the block shrinks by the same
+        factor, but never below maximum_size. The threshold must be below
+        1 / growth_factor: a list that just shrank is then more than the
+        threshold full, and a list that just grew is less than full, so
+        alternating adds and removes near a boundary cannot resize each time.
         """
+        if growth_factor <= 1:
+            raise ValueError("growth_factor must be greater than 1")
+        if not 0 <= shrink_threshold < 1 / growth_factor:
+            raise ValueError("shrink_threshold must be in [0, 1 / growth_factor)")
         # This is how many elements the list can hold
         self._maximum_size: int = maximum_size
         # This is how many actual elements are in the list
         self._actual_size: int = 0
         # This is the actual data storage
-        self._data: list = [None] * maximum_size
+        self._data: list = self._new_block(maximum_size)
+        # Resize policy; the list never shrinks below its initial size
+        self._growth_factor: float = growth_factor
+        self._shrink_threshold: float = shrink_threshold
+        self._minimum_size: int = maximum_size
+        # Counters reported by stats()
+        self._resizes: int = 0
+        self._copies: int = 0
+        self._peak_capacity: int = maximum_size
 
     def __len__(self) -> int:
         """Return the number of actual elements in the list."""
@@ -37,11 +62,12 @@ class MyList:
             # The list is not empty, so we add the opening bracket and prepare
             # to add the elements. We start with the first element to avoid adding
             # a separator before it.
-            list_str += f"{self._OPEN_STR}{self._data[0]}"
+            values = self._values()
+            list_str += f"{self._OPEN_STR}{values[0]}"
             for i in range(1, self._actual_size):
                 # For each element after the first, we add a separator and the
                 # element itself.
-                list_str += f"{self._SEPARATOR}{self._data[i]}"
+                list_str += f"{self._SEPARATOR}{values[i]}"
             # Finally, we add the closing bracket and return the string
             list_str += self._CLOSE_STR
         return list_str
@@ -53,21 +79,63 @@ class MyList:
         # methods to implement new functionality, avoiding code duplication.
         self.insert(self._actual_size, value)
 
-    def _ensure_capacity(self, factor: int = _RESIZE_BY) -> None:
-        """Ensure that there is space to add new elements, resizing if necessary by
-        the given factor."""
-        # If the actual size is equal to the maximum size, we need to resize,
-        # otherwise we have enough space and no action is needed.
-        if self._actual_size == self._maximum_size:
-            # Resize the internal storage by the factor specified
-            self._maximum_size *= factor
-            # Create a new temporary list to hold the resized data
-            temp = [None] * self._maximum_size
-            # Copy the existing data to the new list
-            for i in range(self._actual_size):
-                temp[i] = self._data[i]
-            # Update the internal data reference to point to the new list
-            self._data = temp
+    def _values(self) -> list:
+        """Return a copy of the actual elements, in order."""
+        return self._data[:self._actual_size]
+
+    def _new_block(self, size: int) -> list:
+        """Return a block of storage with the given number of vacant slots."""
+        return [self._VACANT] * size
+
+    def _block_of(self, values) -> list:
+        """Return the given values as a block that can be slice-assigned
+        into the storage."""
+        return list(values)
+
+    def _resize(self, new_size: int) -> None:
+        """Move the elements to a new block of the given size."""
+        # Create a new temporary list to hold the resized data
+        temp = self._new_block(new_size)
+        # Copy the existing data to the new list in one slice assignment
+        temp[:self._actual_size] = self._values()
+        # Update the internal data reference to point to the new list
+        self._data = temp
+        self._maximum_size = new_size
+        # Keep track of the cost of resizing
+        self._resizes += 1
+        self._copies += self._actual_size
+        self._peak_capacity = max(self._peak_capacity, new_size)
+
+    def _ensure_capacity(self, factor: float | None = None,
+                         needed: int = 1) -> None:
+        """Ensure that there is space to add the needed number of new elements,
+        resizing if necessary by the given factor, or by the list's growth
+        factor if none is given."""
+        if factor is None:
+            factor = self._growth_factor
+        # If the new elements do not fit, we need to resize, otherwise we have
+        # enough space and no action is needed.
+        if self._actual_size + needed > self._maximum_size:
+            # Grow by the factor specified, as many times as needed, growing by
+            # at least one element so that small blocks and factors still grow.
+            # The data is copied only once, to the final block.
+            new_size = self._maximum_size
+            while self._actual_size + needed > new_size:
+                new_size = max(int(new_size * factor), new_size + 1)
+            self._resize(new_size)
+
+    def _release_capacity(self) -> None:
+        """Shrink the internal storage by the growth factor for as long as the
+        list is at most shrink_threshold full, without going below the initial
+        size. The data is copied only once, to the final block."""
+        new_size = self._maximum_size
+        while (self._shrink_threshold > 0
+               and new_size > self._minimum_size
+               and self._actual_size <= new_size * self._shrink_threshold):
+            new_size = max(int(new_size / self._growth_factor),
+                           self._minimum_size)
+        if new_size != self._maximum_size:
+            self._resize(new_size)
 
     def insert(self, index: int, value) -> None:
         """Insert value at the given index, shifting elements as necessary.
@@ -76,11 +144,9 @@ class MyList:
         if 0 <= index <= self._actual_size:
             # Ensure there is enough capacity to add a new element
             self._ensure_capacity()
-            # shift right (end → index)
-            i = self._actual_size - 1
-            while i >= index:
-                self._data[i + 1] = self._data[i]
-                i -= 1
+            # shift right (end → index) in one slice assignment
+            self._data[index + 1:self._actual_size + 1] = \
+                self._data[index:self._actual_size]
             # insert the new value
             self._data[index] = value
             # Increment the actual size to reflect the addition
@@ -96,12 +162,56 @@ class MyList:
             # Retrieve the value to be removed
             removed = self._data[index]
             # Shift elements to the left to fill gap left by the removed element
-            for i in range(index, self._actual_size - 1):
-                self._data[i] = self._data[i + 1]
+            self._data[index:self._actual_size - 1] = \
+                self._data[index + 1:self._actual_size]
             # Clear the last position which is now a duplicate after shifting
-            self._data[self._actual_size - 1] = None
+            self._data[self._actual_size - 1] = self._VACANT
             # Decrement the actual size to reflect the removal
             self._actual_size -= 1
+            # Give memory back if the list has drained enough
+            self._release_capacity()
+        return removed
+
+    def extend(self, values) -> None:
+        """Append all the given values to the end of the list."""
+        self.insert_many(self._actual_size, values)
+
+    def insert_many(self, index: int, values) -> None:
+        """Insert all the given values at the given index, in order, with a
+        single resize and a single shift for the whole batch. If the index
+        is invalid, do nothing."""
+        # Validate the index and proceed only if it's valid
+        if 0 <= index <= self._actual_size:
+            block = self._block_of(values)
+            count = len(block)
+            # Make room for the whole batch at once
+            self._ensure_capacity(needed=count)
+            # Shift the tail right by the size of the batch, then drop the
+            # batch into the gap
+            self._data[index + count:self._actual_size + count] = \
+                self._data[index:self._actual_size]
+            self._data[index:index + count] = block
+            self._actual_size += count
+
+    def remove_range(self, start: int, stop: int):
+        """Remove the elements from index start up to, but not including,
+        index stop, with a single shift, and return them. If the range is
+        invalid, return None."""
+        # Initialize the variable to hold the removed values
+        removed = None
+        # Validate the range and proceed only if it's valid
+        if 0 <= start <= stop <= self._actual_size:
+            removed = self._data[start:stop]
+            count = stop - start
+            # Shift the tail left over the removed elements
+            self._data[start:self._actual_size - count] = \
+                self._data[stop:self._actual_size]
+            # Clear the positions which are now duplicates after shifting
+            self._data[self._actual_size - count:self._actual_size] = \
+                self._new_block(count)
+            self._actual_size -= count
+            # Give memory back if the list has drained enough
+            self._release_capacity()
         return removed
 
     def pop(self):
@@ -110,6 +220,16 @@ class MyList:
         # Reuse the remove() method to remove the last element
         return self.remove(self._actual_size - 1)
 
+    def stats(self) -> dict:
+        """Return the number of resizes, the number of elements copied by
+        them, and the peak and current capacity of the list."""
+        return {
+            "resizes": self._resizes,
+            "copies": self._copies,
+            "peak_capacity": self._peak_capacity,
+            "capacity": self._maximum_size,
+        }
+
 
 
 
@@ -160,3 +280,11 @@ if __name__ == "__main__":
     print(test)                                 # 0/8; List is empty
     print(test.pop())                           # None
 
+    ### test 3: growing by 1.5 and shrinking when a quarter full
+    spike = MyList(growth_factor=1.5, shrink_threshold=0.25)
+    for i in range(100_000):
+        spike.append(i)
+    while len(spike) > 10:
+        spike.pop()
+    print(spike.stats())  # capacity back down, peak_capacity still high
+
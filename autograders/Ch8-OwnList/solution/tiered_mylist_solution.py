@@ -0,0 +1,327 @@
+from math import isqrt
+from circular_mylist_solution import CircularMyList
+from mylist_solution import MyList
+
+
+class TieredMyList:
+    """A list with the API of MyList, made of blocks of b elements, each a
+    CircularMyList. Every block but the last is full, so the element at
+    index i is at position i % b of block i // b, and indexing is O(1).
+
+    Inserting in the middle shifts at most b elements inside one block, then
+    moves one element from the back of every following block to the front of
+    the next; both ends of a ring are O(1), so this costs O(b + n / b). The
+    carries work on the rings' fields directly, without going through the
+    public methods of CircularMyList and their capacity checks.
+    Removing works the other way around. The block size is kept near
+    sqrt(n): it is the smallest b with b * b at least the capacity of the
+    list. The capacity follows the resize policy of MyList: it grows by
+    growth_factor when n passes it and shrinks by the same factor when n
+    drops to shrink_threshold of it, and the blocks are rebuilt each time.
+    That keeps insert and remove at O(sqrt(n)) and costs O(1) amortized per
+    operation. Unlike MyList, the list shrinks by default, at 1/16 full.
+
+    insert_many and remove_range rewrite the blocks from the one holding the
+    index on, once per batch, and stats() counts the rebuilds as resizes."""
+
+    # --- Constants for __str__, as in MyList ---
+    _EMPTY = MyList._EMPTY
+    _OPEN_STR = MyList._OPEN_STR
+    _CLOSE_STR = MyList._CLOSE_STR
+    _SEPARATOR = MyList._SEPARATOR
+    # --- Default values ---
+    _MIN_BLOCK_SIZE = 4
+    _SHRINK_AT = 1 / 16
+
+    def __init__(self, maximum_size: int = MyList._DEFAULT_SIZE,
+                 growth_factor: float = MyList._RESIZE_BY,
+                 shrink_threshold: float = _SHRINK_AT):
+        """Create an empty list laid out for maximum_size elements. The
+        arguments mean what they mean for MyList, and are checked the same
+        way; values are added with extend()."""
+        if growth_factor <= 1:
+            raise ValueError("growth_factor must be greater than 1")
+        if not 0 <= shrink_threshold < 1 / growth_factor:
+            raise ValueError("shrink_threshold must be in [0, 1 / growth_factor)")
+        # This is how many elements the blocks are laid out for
+        self._maximum_size: int = maximum_size
+        # This is how many actual elements are in the list
+        self._actual_size: int = 0
+        # Resize policy; the list never shrinks below its initial size
+        self._growth_factor: float = growth_factor
+        self._shrink_threshold: float = shrink_threshold
+        self._minimum_size: int = maximum_size
+        # The blocks, all of the same capacity, and that capacity
+        self._blocks: list[CircularMyList] = []
+        self._block_size: int = self._MIN_BLOCK_SIZE
+        # Counters reported by stats()
+        self._resizes: int = 0
+        self._copies: int = 0
+        self._peak_capacity: int = maximum_size
+        self._rebuild([])
+
+    def __len__(self) -> int:
+        """Return the number of actual elements in the list."""
+        return self._actual_size
+
+    def __str__(self) -> str:
+        """Return a string representation of the list, in the format of
+        MyList. The maximum size is the capacity the blocks are laid out
+        for."""
+        list_str = f"{self._actual_size}/{self._maximum_size}; "
+        if self._actual_size == 0:
+            list_str += self._EMPTY
+        else:
+            list_str += self._OPEN_STR
+            list_str += self._SEPARATOR.join(str(value) for value in self._values())
+            list_str += self._CLOSE_STR
+        return list_str
+
+    def _values(self) -> list:
+        """Return a copy of the actual elements, in order."""
+        values = []
+        for block in self._blocks:
+            values.extend(block._values())
+        return values
+
+    def _fill(self, values: list) -> None:
+        """Append the given values after the last element: top up the last
+        block, then add as many full blocks as needed."""
+        start = 0
+        if self._blocks and len(self._blocks[-1]) < self._block_size:
+            start = self._block_size - len(self._blocks[-1])
+            self._blocks[-1].extend(values[:start])
+        for start in range(start, len(values), self._block_size):
+            block = CircularMyList(self._block_size)
+            block.extend(values[start:start + self._block_size])
+            self._blocks.append(block)
+        self._actual_size += len(values)
+
+    def _rebuild(self, values: list) -> None:
+        """Rebuild the blocks for the given values, with the smallest block
+        size b, at least the minimum, such that b * b >= the capacity."""
+        block_size = isqrt(max(self._maximum_size, 1) - 1) + 1
+        self._block_size = max(block_size, self._MIN_BLOCK_SIZE)
+        self._blocks = []
+        self._actual_size = 0
+        self._fill(values)
+
+    def _rebalance(self) -> None:
+        """Grow or shrink the capacity as MyList does, then rebuild the blocks
+        if it has changed. The threshold is below 1 / growth_factor, so a
+        rebuild is never followed by another one until n has changed by a
+        constant factor."""
+        new_size = self._maximum_size
+        while self._actual_size > new_size:
+            new_size = max(int(new_size * self._growth_factor), new_size + 1)
+        while (self._shrink_threshold > 0
+               and new_size > self._minimum_size
+               and self._actual_size <= new_size * self._shrink_threshold):
+            new_size = max(int(new_size / self._growth_factor),
+                           self._minimum_size)
+        if new_size != self._maximum_size:
+            self._maximum_size = new_size
+            # Keep track of the cost of rebuilding
+            self._resizes += 1
+            self._copies += self._actual_size
+            self._peak_capacity = max(self._peak_capacity, new_size)
+            self._rebuild(self._values())
+
+    def _cut(self, index: int) -> list:
+        """Drop the elements from the given valid index on, together with the
+        blocks they leave empty, and return them in order."""
+        position, offset = divmod(index, self._block_size)
+        rest = []
+        for block in self._blocks[position:]:
+            rest.extend(block._values())
+        del self._blocks[position:]
+        self._actual_size = position * self._block_size
+        # The elements of the cut block before the index go back in.
+        self._fill(rest[:offset])
+        return rest[offset:]
+
+    def _locate(self, index: int) -> tuple[CircularMyList, int]:
+        """Return the block holding the given valid index and the position
+        in _data of that block where the element is."""
+        block = self._blocks[index // self._block_size]
+        return block, block._slot(index % self._block_size)
+
+    def __getitem__(self, index: int):
+        """Return the element at the given index in O(1). Negative indices
+        count from the end. Raises IndexError if the index is invalid."""
+        if index < 0:
+            index += self._actual_size
+        if not 0 <= index < self._actual_size:
+            raise IndexError("list index out of range")
+        block, slot = self._locate(index)
+        return block._data[slot]
+
+    def __setitem__(self, index: int, value) -> None:
+        """Replace the element at the given index in O(1). Negative indices
+        count from the end. Raises IndexError if the index is invalid."""
+        if index < 0:
+            index += self._actual_size
+        if not 0 <= index < self._actual_size:
+            raise IndexError("list assignment index out of range")
+        block, slot = self._locate(index)
+        block._data[slot] = value
+
+    def append(self, value):
+        """Append value to the end of the list."""
+        self.insert(self._actual_size, value)
+
+    def extend(self, values) -> None:
+        """Append all the given values to the end of the list, filling the
+        last blocks, then rebalancing once."""
+        self._fill(list(values))
+        self._rebalance()
+
+    def insert(self, index: int, value) -> None:
+        """Insert value at the given index, shifting elements as necessary.
+        If the index is invalid, do nothing."""
+        # Validate the index and proceed only if it's valid
+        if 0 <= index <= self._actual_size:
+            size = self._block_size
+            position = index // size
+            if position == len(self._blocks):
+                self._blocks.append(CircularMyList(size))
+            # Insert into the block, first taking out its last element if it
+            # is full; that element then moves on to the next block.
+            block = self._blocks[position]
+            carrying = block._actual_size == size
+            if carrying:
+                slot = block._slot(size - 1)
+                carried = block._data[slot]
+                block._data[slot] = block._VACANT
+                block._actual_size -= 1
+            block.insert(index % size, value)
+            position += 1
+            while carrying:
+                if position == len(self._blocks):
+                    self._blocks.append(CircularMyList(size))
+                block = self._blocks[position]
+                # Step the head back onto the slot before it. In a full ring
+                # that slot holds the last element, which is carried on.
+                block._head = (block._head - 1) % size
+                carrying = block._actual_size == size
+                if carrying:
+                    carried, block._data[block._head] = \
+                        block._data[block._head], carried
+                else:
+                    block._data[block._head] = carried
+                    block._actual_size += 1
+                position += 1
+            # Increment the actual size to reflect the addition
+            self._actual_size += 1
+            self._rebalance()
+
+    def remove(self, index: int):
+        """Remove and return the element at the given index, shifting elements
+        as necessary. If the index is invalid, return None."""
+        # Initialize the variable to hold the removed value
+        removed = None
+        # Validate the index and proceed only if it's valid
+        if 0 <= index < self._actual_size:
+            size = self._block_size
+            position = index // size
+            previous = self._blocks[position]
+            removed = previous.remove(index % size)
+            # Refill the block from the front of the next one, and so on, so
+            # that every block but the last stays full.
+            for following in range(position + 1, len(self._blocks)):
+                block = self._blocks[following]
+                previous._data[previous._slot(previous._actual_size)] = \
+                    block._data[block._head]
+                previous._actual_size += 1
+                block._data[block._head] = block._VACANT
+                block._head = (block._head + 1) % size
+                block._actual_size -= 1
+                previous = block
+            if self._blocks[-1]._actual_size == 0:
+                self._blocks.pop()
+            # Decrement the actual size to reflect the removal
+            self._actual_size -= 1
+            self._rebalance()
+        return removed
+
+    def insert_many(self, index: int, values) -> None:
+        """Insert all the given values at the given index, in order, writing
+        the blocks from the index on once, then rebalancing once. If the
+        index is invalid, do nothing."""
+        # Validate the index and proceed only if it's valid
+        if 0 <= index <= self._actual_size:
+            values = list(values)
+            rest = self._cut(index)
+            self._fill(values + rest)
+            self._rebalance()
+
+    def remove_range(self, start: int, stop: int):
+        """Remove the elements from index start up to, but not including,
+        index stop, writing the blocks from start on once, and return them.
+        If the range is invalid, return None."""
+        # Initialize the variable to hold the removed values
+        removed = None
+        # Validate the range and proceed only if it's valid
+        if 0 <= start <= stop <= self._actual_size:
+            rest = self._cut(start)
+            removed = rest[:stop - start]
+            self._fill(rest[stop - start:])
+            self._rebalance()
+        return removed
+
+    def pop(self):
+        """Remove and return the last element of the list. If the list is empty,
+        return None."""
+        return self.remove(self._actual_size - 1)
+
+    def stats(self) -> dict:
+        """Return the statistics of MyList.stats(): resizes are rebuilds of
+        the blocks, and copies the elements they moved. The block size is
+        reported too."""
+        return {
+            "resizes": self._resizes,
+            "copies": self._copies,
+            "peak_capacity": self._peak_capacity,
+            "capacity": self._maximum_size,
+            "block_size": self._block_size,
+        }
+
+
+# --- Benchmark: random-position edits against MyList and the builtin list ---
+if __name__ == "__main__":
+    import random
+    import time
+
+    EDITS = 500
+    random.seed(271)
+    for size in (10_000, 100_000, 1_000_000):
+        values = list(range(size))
+        positions = [random.randrange(size) for _ in range(EDITS)]
+        results = []
+        for name in ("MyList", "TieredMyList", "list"):
+            if name == "MyList":
+                edited = MyList()
+                edited.extend(values)
+            elif name == "TieredMyList":
+                edited = TieredMyList()
+                edited.extend(values)
+            else:
+                edited = list(values)
+            start = time.perf_counter()
+            for position in positions:
+                edited.insert(position, -1)
+            for position in positions:
+                if name == "list":
+                    edited.pop(position)
+                else:
+                    edited.remove(position)
+            elapsed = time.perf_counter() - start
+            results.append(f"{name} {2 * EDITS / elapsed:10,.0f}")
+        print(f"{size:>9} elements, edits/s: " + ", ".join(results))
+
+    tiered = TieredMyList()
+    for i in range(20):
+        tiered.append(i)
+    tiered.insert(5, "X")
+    print(tiered.remove(0), tiered[4], tiered[-1])  # 0 X 19
+    print(tiered)            # 20/32; [ 1, 2, 3, 4, X, 5, ..., 19 ]
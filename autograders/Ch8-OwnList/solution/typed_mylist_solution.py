@@ -0,0 +1,92 @@
+from array import array
+from mylist_solution import MyList
+
+
+class TypedMyList(MyList):
+    """A MyList for numbers (or characters) of one type, stored in an
+    array.array instead of a list. The array keeps the raw values, e.g. 8
+    bytes for a float with typecode "d", where a list keeps a pointer to a
+    separate object for every element. append, insert, remove, pop, __str__
+    and resizing work exactly as in MyList.
+
+    view() returns a memoryview of the elements, so they can be handed to
+    other code, such as numpy.frombuffer, without copying. The view covers
+    the actual elements of the current block: after a resize, an existing
+    view still shows the old block. Passing the list itself to memoryview()
+    or numpy.frombuffer needs Python 3.12 or later, which adds __buffer__
+    to the buffer protocol; on older versions, use view()."""
+
+    def __init__(self, typecode: str, maximum_size: int = MyList._DEFAULT_SIZE,
+                 growth_factor: float = MyList._RESIZE_BY,
+                 shrink_threshold: float = MyList._SHRINK_AT):
+        """Create an empty list for values of the given array typecode."""
+        self._typecode: str = typecode
+        # Unused slots hold zero; building it from zero bytes works for
+        # every typecode, including the character ones.
+        itemsize = array(typecode).itemsize
+        self._VACANT = array(typecode, bytes(itemsize))[0]
+        super().__init__(maximum_size, growth_factor, shrink_threshold)
+
+    def _new_block(self, size: int) -> array:
+        """Return an array with the given number of zeroed slots."""
+        return array(self._typecode, [self._VACANT]) * size
+
+    def _block_of(self, values) -> array:
+        """Return the given values as an array of the list's typecode."""
+        return array(self._typecode, values)
+
+    def insert(self, index: int, value) -> None:
+        """Insert value at the given index, as MyList does. The value is
+        converted to the typecode first, so a value the array cannot hold
+        raises TypeError or OverflowError before any element is shifted."""
+        super().insert(index, array(self._typecode, [value])[0])
+
+    def typecode(self) -> str:
+        """Return the array typecode of the elements."""
+        return self._typecode
+
+    def view(self) -> memoryview:
+        """Return a memoryview of the actual elements, without copying."""
+        return memoryview(self._data)[:self._actual_size]
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Export the actual elements through the buffer protocol (Python
+        3.12 or later)."""
+        return self.view()
+
+
+# --- Memory comparison with MyList ---
+if __name__ == "__main__":
+    import sys
+    import tracemalloc
+
+    SIZE = 1_000_000
+
+    # The same large ints in a MyList and in 8- and 4-byte typed lists
+    for name, make in (("MyList", lambda: MyList()),
+                       ("TypedMyList('q')", lambda: TypedMyList("q")),
+                       ("TypedMyList('i')", lambda: TypedMyList("i"))):
+        tracemalloc.start()
+        numbers = make()
+        for i in range(SIZE):
+            numbers.append(1_000 + i)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:>17}: {memory / SIZE:5.1f} bytes/element")
+
+    small = TypedMyList("i", 2)
+    for i in range(5):
+        small.append(i * 10)
+    small.insert(1, 5)
+    print(small)                                # 6/8; [ 0, 5, 10, 20, 30, 40 ]
+    print(small.remove(0), small.pop(), small)  # 0 40 4/8; [ 5, 10, 20, 30 ]
+    print(bytes(small.view()) == small._data[:4].tobytes())
+    # A value the typecode cannot hold is rejected, and the list unchanged.
+    for bad in (1.5, 2 ** 40):
+        try:
+            small.insert(0, bad)
+        except (TypeError, OverflowError):
+            pass
+        assert small._values().tolist() == [5, 10, 20, 30], small
+    if sys.version_info >= (3, 12):
+        print(memoryview(small).tolist())       # [5, 10, 20, 30]